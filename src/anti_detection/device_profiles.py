@@ -5,12 +5,13 @@ This module manages a database of real device profiles for emulation.
 """
 
 import os
-import json
 import logging
 import random
 import re
 from pathlib import Path
 
+from .json_io import dumps, read_json
+
 logger = logging.getLogger(__name__)
 
 class DeviceProfileDatabase:
@@ -387,6 +388,11 @@ class DeviceProfileDatabase:
         # Create profiles directory if it doesn't exist
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
         
+        # Sorted profile names, rebuilt when the profiles directory changes
+        # (including writes by other instances or outside the app)
+        self._names_cache = None
+        self._names_cache_mtime = None
+        
         # Load or create default profiles
         self._ensure_default_profiles()
         
@@ -399,11 +405,19 @@ class DeviceProfileDatabase:
             # Save profile to file if it doesn't exist
             profile_path = self.profiles_dir / f"{profile_name}.json"
             if not profile_path.exists():
-                with open(profile_path, "w") as f:
-                    json.dump(profile_data, f, indent=2)
+                self._write_profile_file(profile_path, profile_data)
                     
                 logger.info(f"Created default profile: {profile_name}")
                 
+    def _write_profile_file(self, profile_path, data):
+        """Write a profile as one encoded buffer and move it into place atomically."""
+        encoded = dumps(data)
+        
+        temp_path = profile_path.with_name(profile_path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(encoded)
+        os.replace(temp_path, profile_path)
+        
     def _generate_build_prop(self, profile):
         """Generate build.prop entries from profile data."""
         build_prop = {}
@@ -455,13 +469,19 @@ class DeviceProfileDatabase:
         return build_prop
         
     def get_profile_names(self):
-        """Get names of all available profiles."""
-        profiles = []
+        """Get names of all available profiles as a sorted tuple.
         
-        for profile_path in self.profiles_dir.glob("*.json"):
-            profiles.append(profile_path.stem)
+        The listing is reused while the profiles directory's modification
+        time is unchanged.
+        """
+        mtime = self.profiles_dir.stat().st_mtime_ns
+        if self._names_cache is None or mtime != self._names_cache_mtime:
+            self._names_cache = tuple(sorted(
+                profile_path.stem for profile_path in self.profiles_dir.glob("*.json")
+            ))
+            self._names_cache_mtime = mtime
             
-        return sorted(profiles)
+        return self._names_cache
         
     def get_profile(self, profile_name):
         """Get a specific profile by name."""
@@ -472,8 +492,7 @@ class DeviceProfileDatabase:
             return None
             
         try:
-            with open(profile_path, "r") as f:
-                return json.load(f)
+            return read_json(profile_path)
         except Exception as e:
             logger.error(f"Failed to load profile {profile_name}: {str(e)}")
             return None
@@ -495,9 +514,9 @@ class DeviceProfileDatabase:
             data["build_prop"] = self._generate_build_prop(data)
             
         try:
-            with open(profile_path, "w") as f:
-                json.dump(data, f, indent=2)
+            self._write_profile_file(profile_path, data)
                 
+            self._names_cache = None
             logger.info(f"Created profile: {name}")
             return True
         except Exception as e:
@@ -517,8 +536,7 @@ class DeviceProfileDatabase:
             data["build_prop"] = self._generate_build_prop(data)
             
         try:
-            with open(profile_path, "w") as f:
-                json.dump(data, f, indent=2)
+            self._write_profile_file(profile_path, data)
                 
             logger.info(f"Updated profile: {name}")
             return True
@@ -536,21 +554,30 @@ class DeviceProfileDatabase:
             
         try:
             profile_path.unlink()
+            self._names_cache = None
             logger.info(f"Deleted profile: {name}")
             return True
         except Exception as e:
             logger.error(f"Failed to delete profile {name}: {str(e)}")
             return False
             
-    def get_random_profile(self):
-        """Get a random profile from the available profiles."""
+    def get_random_profile_name(self):
+        """Get the name of a random profile from the available profiles."""
         profiles = self.get_profile_names()
         
         if not profiles:
             logger.warning("No profiles available")
             return None
             
-        random_profile_name = random.choice(profiles)
+        return random.choice(profiles)
+        
+    def get_random_profile(self):
+        """Get a random profile from the available profiles."""
+        random_profile_name = self.get_random_profile_name()
+        
+        if random_profile_name is None:
+            return None
+            
         return self.get_profile(random_profile_name)
 
 
@@ -11,6 +11,8 @@ import logging
 import json
 from pathlib import Path
 
+from .json_io import read_json, write_json
+
 logger = logging.getLogger(__name__)
 
 class HardwareSpoofer:
@@ -61,8 +63,7 @@ class HardwareSpoofer:
             return False
             
         try:
-            with open(profile_file, "r") as f:
-                self.current_profile = json.load(f)
+            self.current_profile = read_json(profile_file)
             logger.info(f"Loaded profile {profile_name}")
             return True
         except Exception as e:
@@ -78,8 +79,7 @@ class HardwareSpoofer:
         profile_file = os.path.join(self.profile_path, f"{profile_name}.json")
         
         try:
-            with open(profile_file, "w") as f:
-                json.dump(self.current_profile, f, indent=2)
+            write_json(profile_file, self.current_profile)
             logger.info(f"Saved profile {profile_name}")
             
             # Update available profiles
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+JSON encoding helpers for the undetected Android emulator.
+This module uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj):
+        """Encode an object as indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    try:
+        import msgspec
+        loads = msgspec.json.decode
+    except ImportError:
+        loads = json.loads
+
+    def dumps(obj):
+        """Encode an object as indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+def read_json(path):
+    """Read and decode a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+def write_json(path, obj):
+    """Encode an object and write it to a JSON file in a single write."""
+    with open(path, "wb") as f:
+        f.write(dumps(obj))
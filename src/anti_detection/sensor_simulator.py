@@ -13,6 +13,8 @@ import os
 from pathlib import Path
 import threading
 
+from .json_io import read_json, write_json
+
 # Import ML sensor generator if available
 try:
     from .ml_sensor_generator import MLSensorGenerator
@@ -97,8 +99,7 @@ class SensorSimulator:
             return False
             
         try:
-            with open(profile_file, "r") as f:
-                self.current_profile = json.load(f)
+            self.current_profile = read_json(profile_file)
             logger.info(f"Loaded sensor profile {profile_name}")
             return True
         except Exception as e:
@@ -114,8 +115,7 @@ class SensorSimulator:
         profile_file = os.path.join(self.profile_path, f"{profile_name}.json")
         
         try:
-            with open(profile_file, "w") as f:
-                json.dump(self.current_profile, f, indent=2)
+            write_json(profile_file, self.current_profile)
             logger.info(f"Saved sensor profile {profile_name}")
             
             # Update available profiles
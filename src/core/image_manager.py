@@ -17,8 +17,66 @@ import json
 from pathlib import Path
 from threading import Thread, Event
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# ioctl request for a copy-on-write clone of a whole file (btrfs, XFS)
+FICLONE = 0x40049409
+
+def _reflink(source_path, target_path):
+    """Clone a file with FICLONE; raises OSError if the filesystem cannot."""
+    if fcntl is None:
+        raise OSError("reflink is not supported on this platform")
+        
+    with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+# Chunk size for sendfile copies and buffer size for user-space copies
+COPY_CHUNK_SIZE = 16 * 1024 * 1024
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+def _copy_file(source_path, target_path, progress=None):
+    """Copy file data and metadata using os.sendfile where available.
+    
+    progress, if given, is called with the percentage copied whenever it
+    changes.
+    """
+    use_sendfile = sys.platform.startswith("linux")
+    
+    with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        if not use_sendfile and progress is None:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        else:
+            total = os.fstat(src.fileno()).st_size
+            last_percent = -1
+            offset = 0
+            
+            while True:
+                if use_sendfile:
+                    # Kernel-side copy; no user-space buffer. Other platforms
+                    # only support sendfile to sockets
+                    copied = os.sendfile(dst.fileno(), src.fileno(), offset, COPY_CHUNK_SIZE)
+                else:
+                    chunk = src.read(COPY_BUFFER_SIZE)
+                    dst.write(chunk)
+                    copied = len(chunk)
+                    
+                if copied == 0:
+                    break
+                offset += copied
+                
+                if progress is not None and total:
+                    percent = offset * 100 // total
+                    if percent != last_percent:
+                        last_percent = percent
+                        progress(percent)
+            
+    shutil.copystat(source_path, target_path)
+
 class ImageManager:
     """Handles Android-x86 image downloading and management."""
     
@@ -71,39 +129,72 @@ class ImageManager:
         self.download_progress = 0
         self.download_cancel = Event()
         self._available_images = None
+        self._available_images_mtime = None
         
     def get_available_images(self, force_refresh=False):
-        """Get list of available images (cached unless force_refresh is True)."""
-        if self._available_images is None or force_refresh:
+        """Get list of available images.
+        
+        The scan is cached and reused while the storage directory's
+        modification time is unchanged, unless force_refresh is True.
+        """
+        mtime = self.storage_dir.stat().st_mtime_ns
+        if (self._available_images is None or force_refresh
+                or mtime != self._available_images_mtime):
             self._available_images = self._scan_available_images()
+            self._available_images_mtime = mtime
         return self._available_images
     
     def _scan_available_images(self):
         """Scan the storage directory for available images."""
         available = []
         
-        for image_path in self.storage_dir.glob("*.iso"):
-            # Extract version from filename (assumes filename format: android-x86_VERSION_TYPE.iso)
-            try:
-                filename = image_path.name
-                if filename.startswith("android-x86_"):
-                    parts = filename.split('_')
-                    if len(parts) >= 2:
-                        version = parts[1]
-                        image_type = parts[2].split('.')[0] if len(parts) >= 3 else "unknown"
-                        
-                        image_info = {
-                            "version": version,
-                            "type": image_type,
-                            "path": str(image_path),
-                            "size": image_path.stat().st_size,
-                            "filename": filename
-                        }
-                        available.append(image_info)
-            except Exception as e:
-                logger.warning(f"Failed to parse image info for {image_path}: {str(e)}")
+        # One directory read; is_file() uses the entry type from the listing
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("android-x86_") and name.endswith(".iso")):
+                    continue
+                    
+                try:
+                    if not entry.is_file():
+                        continue
+                    size = entry.stat().st_size
+                except OSError as e:
+                    logger.warning(f"Failed to stat image {entry.path}: {str(e)}")
+                    continue
+                    
+                image_info = self.get_image_info(entry.path, size=size)
+                if image_info:
+                    available.append(image_info)
                 
         return available
+        
+    def get_image_info(self, image_path, size=None):
+        """Build the info dictionary for an image file, or None if it is not an Android-x86 image.
+        
+        The file is only stat'ed when size is not given.
+        """
+        # Extract version from filename (assumes filename format: android-x86_VERSION_TYPE.iso)
+        try:
+            image_path = Path(image_path)
+            filename = image_path.name
+            if filename.startswith("android-x86_"):
+                parts = filename.split('_')
+                if len(parts) >= 2:
+                    version = parts[1]
+                    image_type = parts[2].split('.')[0] if len(parts) >= 3 else "unknown"
+                    
+                    return {
+                        "version": version,
+                        "type": image_type,
+                        "path": str(image_path),
+                        "size": image_path.stat().st_size if size is None else size,
+                        "filename": filename
+                    }
+        except Exception as e:
+            logger.warning(f"Failed to parse image info for {image_path}: {str(e)}")
+            
+        return None
     
     def download_image(self, version, image_type="x86_64", callback=None):
         """
@@ -354,6 +445,50 @@ class ImageManager:
             logger.error(f"Failed to create empty disk image: {str(e)}")
             return None
             
+    def import_file(self, source_path, target_path, progress=None):
+        """Bring an existing image file into the storage directory.
+        
+        Tries a hard link first, then a copy-on-write clone, and only copies
+        the data when neither is possible. The file is staged next to the
+        target and moved into place, so an existing target is only replaced
+        once the import succeeded. progress, if given, is called with the
+        percentage done. Returns the target path. Raises shutil.SameFileError
+        if the source already is the target.
+        """
+        target_path = Path(target_path)
+        if target_path.exists() and os.path.samefile(source_path, target_path):
+            # Linking onto the same inode would leave the staging file behind
+            raise shutil.SameFileError(f"{source_path} is already {target_path}")
+            
+        staging_path = target_path.with_name(target_path.name + ".part")
+        
+        if staging_path.exists():
+            staging_path.unlink()
+            
+        try:
+            try:
+                os.link(source_path, staging_path)
+                method = "hard link"
+            except OSError:
+                try:
+                    _reflink(source_path, staging_path)
+                    method = "reflink"
+                except OSError:
+                    _copy_file(source_path, staging_path, progress)
+                    method = "copy"
+                    
+            os.replace(staging_path, target_path)
+            if progress is not None:
+                progress(100)
+        except Exception:
+            if staging_path.exists():
+                staging_path.unlink()
+            raise
+            
+        self._available_images = None
+        logger.info(f"Imported {source_path} to {target_path} ({method})")
+        return str(target_path)
+        
     def delete_image(self, image_path):
         """Delete an image file."""
         try:
@@ -374,6 +509,40 @@ class ImageManager:
             logger.error(f"Failed to delete image {image_path}: {str(e)}")
             return False
             
+    def delete_images(self, image_paths):
+        """Delete several image files and return the paths that were deleted.
+        
+        Files in the storage directory are unlinked relative to an open
+        handle on that directory where the platform supports it.
+        """
+        deleted = []
+        dir_fd = None
+        if os.unlink in os.supports_dir_fd:
+            dir_fd = os.open(self.storage_dir, os.O_RDONLY)
+            
+        try:
+            for image_path in image_paths:
+                image_path = Path(image_path)
+                try:
+                    if dir_fd is not None and image_path.parent == self.storage_dir:
+                        os.unlink(image_path.name, dir_fd=dir_fd)
+                    else:
+                        image_path.unlink()
+                    deleted.append(str(image_path))
+                except OSError as e:
+                    logger.error(f"Failed to delete image {image_path}: {str(e)}")
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+                
+        if deleted:
+            logger.info(f"Deleted {len(deleted)} images")
+            
+            # Refresh available images
+            self._available_images = None
+            
+        return deleted
+        
     def get_latest_version(self):
         """Get the latest available Android-x86 version."""
         if self.AVAILABLE_VERSIONS:
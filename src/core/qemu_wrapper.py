@@ -124,6 +124,10 @@ class QEMUWrapper:
         """Set a QEMU parameter."""
         self.params[key] = value
         
+    def update_params(self, params):
+        """Set several QEMU parameters at once."""
+        self.params.update(params)
+        
     def get_param(self, key):
         """Get a QEMU parameter."""
         return self.params.get(key)
@@ -268,6 +272,14 @@ class QEMUWrapper:
             return False
             
         return self.qemu_process.poll() is None
+        
+    def reap(self):
+        """Collect an exited QEMU process; return True if it has exited."""
+        if not self.qemu_process or self.qemu_process.poll() is None:
+            return False
+            
+        self.is_running = False
+        return True
             
     def screenshot(self, output_path):
         """Take a screenshot of the current VM state."""
@@ -4,7 +4,6 @@ Device profile selection dialog for the emulator GUI.
 This module provides a dialog for selecting and configuring device profiles.
 """
 
-import os
 import sys
 import logging
 import json
@@ -15,7 +14,8 @@ try:
         QPushButton, QGroupBox, QFormLayout, QDialogButtonBox,
         QTabWidget, QWidget, QLineEdit, QCheckBox, QMessageBox
     )
-    from PyQt5.QtCore import Qt, pyqtSignal
+    from PyQt5.QtCore import Qt, QSignalBlocker, pyqtSignal
+    from PyQt5.QtGui import QStandardItem, QStandardItemModel
     USE_PYQT5 = True
 except ImportError:
     try:
@@ -24,25 +24,39 @@ except ImportError:
             QPushButton, QGroupBox, QFormLayout, QDialogButtonBox,
             QTabWidget, QWidget, QLineEdit, QCheckBox, QMessageBox
         )
-        from PySide6.QtCore import Qt, Signal as pyqtSignal
+        from PySide6.QtCore import Qt, QSignalBlocker, Signal as pyqtSignal
+        from PySide6.QtGui import QStandardItem, QStandardItemModel
         USE_PYQT5 = False
     except ImportError:
         print("Error: Neither PyQt5 nor PySide6 is installed. Please install one of them.")
         sys.exit(1)
 
-# Add parent directory to path to import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 try:
-    from utils.device_profile_db import DeviceProfileDB
-    from anti_detection.hardware_spoof import HardwareSpoofer
+    from ..utils.device_profile_db import DeviceProfileDB
+    from ..anti_detection.hardware_spoof import HardwareSpoofer
 except ImportError as e:
     print(f"Error importing modules: {e}")
-    print("Make sure you're running this script from the project root directory.")
+    print("Make sure you're running this module from the project root directory "
+          "(python -m src.gui.device_profile_dialog).")
     sys.exit(1)
 
 logger = logging.getLogger(__name__)
 
+def _fill_combo(combo, entries):
+    """Replace a combo box's items with (text, data) pairs in a single model swap.
+    
+    Signals are blocked while the model is replaced, so callers trigger any
+    dependent updates themselves once the combo is filled.
+    """
+    model = QStandardItemModel(combo)
+    for text, data in entries:
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        model.appendRow(item)
+        
+    with QSignalBlocker(combo):
+        combo.setModel(model)
+
 class DeviceProfileDialog(QDialog):
     """Dialog for selecting and configuring device profiles."""
     
@@ -109,6 +123,12 @@ class DeviceProfileDialog(QDialog):
         self.device_combo = QComboBox()
         self.android_version_combo = QComboBox()
         
+        # These combos are refilled on every selection change; a fixed
+        # minimum width avoids recomputing the size hint from the contents
+        for combo in (self.manufacturer_combo, self.device_combo, self.android_version_combo):
+            combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+            combo.setMinimumContentsLength(20)
+        
         selection_layout.addRow("Manufacturer:", self.manufacturer_combo)
         selection_layout.addRow("Device:", self.device_combo)
         selection_layout.addRow("Android Version:", self.android_version_combo)
@@ -160,8 +180,11 @@ class DeviceProfileDialog(QDialog):
         self.custom_model_input = QLineEdit("Galaxy S21")
         
         self.custom_android_version_combo = QComboBox()
-        for version in ["8.0", "8.1", "9.0", "10.0", "11.0", "12.0", "13.0", "14.0"]:
-            self.custom_android_version_combo.addItem(f"Android {version}", version)
+        _fill_combo(
+            self.custom_android_version_combo,
+            ((f"Android {version}", version)
+             for version in ["8.0", "8.1", "9.0", "10.0", "11.0", "12.0", "13.0", "14.0"])
+        )
         self.custom_android_version_combo.setCurrentIndex(5)  # Default to Android 12.0
         
         basic_layout.addRow("Manufacturer:", self.custom_manufacturer_input)
@@ -217,10 +240,10 @@ class DeviceProfileDialog(QDialog):
         
     def _load_manufacturers(self):
         """Load the list of manufacturers."""
-        self.manufacturer_combo.clear()
-        
-        for manufacturer in self.db.get_manufacturers():
-            self.manufacturer_combo.addItem(manufacturer, manufacturer)
+        _fill_combo(
+            self.manufacturer_combo,
+            ((manufacturer, manufacturer) for manufacturer in self.db.get_manufacturers())
+        )
             
         if self.manufacturer_combo.count() > 0:
             # Load devices for first manufacturer
@@ -232,11 +255,8 @@ class DeviceProfileDialog(QDialog):
         if not manufacturer:
             return
             
-        self.device_combo.clear()
-        
         devices = self.db.get_devices(manufacturer)
-        for device in devices:
-            self.device_combo.addItem(device, device)
+        _fill_combo(self.device_combo, ((device, device) for device in devices))
             
         if self.device_combo.count() > 0:
             # Load details for first device
@@ -257,10 +277,10 @@ class DeviceProfileDialog(QDialog):
             return
             
         # Update Android version combo
-        self.android_version_combo.clear()
-        
-        for version in profile["android_versions"]:
-            self.android_version_combo.addItem(f"Android {version}", version)
+        _fill_combo(
+            self.android_version_combo,
+            ((f"Android {version}", version) for version in profile["android_versions"])
+        )
             
         # Set details
         self.model_label.setText(profile["model"])
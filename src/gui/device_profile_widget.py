@@ -7,7 +7,8 @@ This module provides a user interface for managing device profiles.
 import sys
 import os
 import logging
-import json
+import io
+import copy
 from pathlib import Path
 
 try:
@@ -16,7 +17,7 @@ try:
         QListWidget, QListWidgetItem, QMessageBox, QFileDialog, QTabWidget,
         QGroupBox, QFormLayout, QLineEdit, QSpinBox, QTextEdit, QDialog
     )
-    from PyQt5.QtCore import Qt, pyqtSignal
+    from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
     from PyQt5.QtGui import QIcon
 except ImportError:
     from PySide6.QtWidgets import (
@@ -24,113 +25,290 @@ except ImportError:
         QListWidget, QListWidgetItem, QMessageBox, QFileDialog, QTabWidget,
         QGroupBox, QFormLayout, QLineEdit, QSpinBox, QTextEdit, QDialog
     )
-    from PySide6.QtCore import Qt, Signal as pyqtSignal
+    from PySide6.QtCore import Qt, Signal as pyqtSignal, Slot as pyqtSlot
     from PySide6.QtGui import QIcon
 
 from ..anti_detection.device_profiles import DeviceProfileDatabase
+from ..anti_detection.json_io import read_json, write_json
+from .workers import run_in_background
 
 logger = logging.getLogger(__name__)
 
+def _read_profile_file(file_path):
+    """Read and decode a profile JSON file."""
+    return read_json(file_path)
+
+def _write_profile_file(file_path, profile):
+    """Encode and write a profile JSON file, returning its path."""
+    write_json(file_path, profile)
+    return file_path
+
+# Fields an imported profile must provide
+_REQUIRED_IMPORT_FIELDS = frozenset({"manufacturer", "model", "android_version"})
+
+# Hardware defaults used for custom profiles. These are copied on use so the
+# templates themselves are never mutated.
+_DEFAULT_SENSORS = {
+    "accelerometer": {
+        "name": "BMI160 Accelerometer",
+        "vendor": "Bosch",
+        "resolution": 0.0012,
+        "max_range": 39.2266,
+        "power": 0.13,
+        "min_delay": 10000
+    },
+    "gyroscope": {
+        "name": "BMI160 Gyroscope",
+        "vendor": "Bosch",
+        "resolution": 0.001,
+        "max_range": 34.906586,
+        "power": 0.13,
+        "min_delay": 10000
+    },
+    "magnetometer": {
+        "name": "AK09915 Magnetometer",
+        "vendor": "AKM",
+        "resolution": 0.15,
+        "max_range": 4912,
+        "power": 0.1,
+        "min_delay": 10000
+    },
+    "light": {
+        "name": "TSL2540 Light sensor",
+        "vendor": "AMS",
+        "resolution": 1.0,
+        "max_range": 65535,
+        "power": 0.1,
+        "min_delay": 0
+    },
+    "proximity": {
+        "name": "TSL2540 Proximity sensor",
+        "vendor": "AMS",
+        "resolution": 1.0,
+        "max_range": 5,
+        "power": 0.1,
+        "min_delay": 0
+    }
+}
+
+_DEFAULT_CPU = {
+    "processors": 8,
+    "architecture": "arm64-v8a",
+    "features": ["neon", "aes", "pmull", "sha1", "sha2", "crc32"],
+    "governor": "schedutil",
+    "min_freq": 300000,
+    "max_freq": 2400000,
+    "abi_list": ["arm64-v8a", "armeabi-v7a", "armeabi"]
+}
+
+_DEFAULT_GPU = {
+    "vendor": "Qualcomm",
+    "renderer": "Adreno 650",
+    "version": "OpenGL ES 3.2",
+    "extensions": []
+}
+
+_DEFAULT_BATTERY = {
+    "capacity": 4000,
+    "technology": "Li-ion"
+}
+
+_DEFAULT_SCREEN = {
+    "density": 420,
+    "width": 1080,
+    "height": 2340,
+    "refresh_rate": 60,
+    "sizeCategory": 4
+}
+
+_DEFAULT_NETWORK = {
+    "imei_prefix": "35291011",
+    "sim_operator": "310260",
+    "cell_operator": "T-Mobile",
+    "network_types": ["LTE", "HSDPA", "HSUPA", "UMTS", "EDGE", "GPRS"]
+}
+
 class ProfileDetailsDialog(QDialog):
-    """Dialog for viewing detailed profile information."""
+    """Dialog for viewing detailed profile information.
+    
+    The dialog builds its widgets once and can be reused for other profiles
+    through load().
+    """
+    
+    BASIC_FIELDS = ('manufacturer', 'model', 'brand', 'product', 'device', 'android_version', 'sdk', 'build_id')
     
     def __init__(self, profile_data, parent=None):
         """Initialize the profile details dialog."""
         super().__init__(parent)
-        self.profile_data = profile_data
-        self.setWindowTitle(f"Profile Details: {profile_data['manufacturer']} {profile_data['model']}")
         self.resize(600, 500)
         self.init_ui()
+        self.load(profile_data)
         
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
         
-        # Create a tab widget for different profile sections
-        tabs = QTabWidget()
+        # Create a tab widget for different profile sections. Tab contents
+        # are only filled in the first time a tab is shown for a profile.
+        self.tabs = QTabWidget()
+        self._tab_loaders = [
+            self._load_basic_tab,
+            self._load_build_prop_tab,
+            self._load_hardware_tab,
+            self._load_sensors_tab,
+        ]
+        self._populated_tabs = set()
         
         # Basic information tab
         basic_tab = QWidget()
-        basic_layout = QFormLayout(basic_tab)
+        self._basic_layout = QFormLayout(basic_tab)
+        self._basic_labels = {}
         
-        for key in ['manufacturer', 'model', 'brand', 'product', 'device', 'android_version', 'sdk', 'build_id']:
-            if key in self.profile_data:
-                basic_layout.addRow(f"{key.replace('_', ' ').title()}:", QLabel(str(self.profile_data[key])))
-                
-        tabs.addTab(basic_tab, "Basic Info")
+        for key in self.BASIC_FIELDS:
+            label = QLabel()
+            self._basic_layout.addRow(f"{key.replace('_', ' ').title()}:", label)
+            self._basic_labels[key] = label
+            
+        self.tabs.addTab(basic_tab, "Basic Info")
         
         # Build.prop tab
         build_tab = QWidget()
         build_layout = QVBoxLayout(build_tab)
         
-        build_text = QTextEdit()
-        build_text.setReadOnly(True)
-        build_text.setLineWrapMode(QTextEdit.NoWrap)
+        self.build_text = QTextEdit()
+        self.build_text.setReadOnly(True)
+        self.build_text.setUndoRedoEnabled(False)
+        self.build_text.setLineWrapMode(QTextEdit.NoWrap)
+        
+        build_layout.addWidget(self.build_text)
+        self.tabs.addTab(build_tab, "Build Properties")
+        
+        # Hardware tab
+        hardware_tab = QWidget()
+        self._hardware_layout = QFormLayout(hardware_tab)
+        self._hardware_labels = {}
+        
+        for key, title in [
+            ("cpu_processors", "CPU Processors:"),
+            ("cpu_architecture", "CPU Architecture:"),
+            ("cpu_features", "CPU Features:"),
+            ("gpu_vendor", "GPU Vendor:"),
+            ("gpu_renderer", "GPU Renderer:"),
+            ("gpu_version", "GPU Version:"),
+            ("screen_resolution", "Screen Resolution:"),
+            ("screen_density", "Screen Density:"),
+            ("screen_refresh_rate", "Refresh Rate:"),
+        ]:
+            label = QLabel()
+            self._hardware_layout.addRow(title, label)
+            self._hardware_labels[key] = label
+            
+        self.tabs.addTab(hardware_tab, "Hardware")
+        
+        # Sensors tab
+        sensors_tab = QWidget()
+        sensors_layout = QVBoxLayout(sensors_tab)
+        
+        self.sensors_text = QTextEdit()
+        self.sensors_text.setReadOnly(True)
+        self.sensors_text.setUndoRedoEnabled(False)
+        
+        sensors_layout.addWidget(self.sensors_text)
+        self.tabs.addTab(sensors_tab, "Sensors")
+        
+        self.tabs.currentChanged.connect(self._populate_tab)
+        
+        # Add the tabs to the layout
+        layout.addWidget(self.tabs)
+        
+        # Add a close button
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        
+        layout.addWidget(close_button)
+        
+    def load(self, profile_data):
+        """Show the details of another profile, reusing the existing widgets."""
+        self.profile_data = profile_data
+        self.setWindowTitle(f"Profile Details: {profile_data['manufacturer']} {profile_data['model']}")
+        
+        self._populated_tabs.clear()
+        self._populate_tab(self.tabs.currentIndex())
+        
+    @pyqtSlot(int)
+    def _populate_tab(self, index):
+        """Fill in the contents of a tab the first time it is shown."""
+        if index < 0 or index in self._populated_tabs:
+            return
+            
+        self._populated_tabs.add(index)
+        self._tab_loaders[index]()
+        
+    @staticmethod
+    def _set_row(layout, label, text):
+        """Set a form row's value, hiding the row when text is None."""
+        visible = text is not None
+        label.setText(text if visible else "")
+        label.setVisible(visible)
+        layout.labelForField(label).setVisible(visible)
+        
+    def _load_basic_tab(self):
+        """Fill in the basic information tab."""
+        for key, label in self._basic_labels.items():
+            value = str(self.profile_data[key]) if key in self.profile_data else None
+            self._set_row(self._basic_layout, label, value)
+            
+    def _load_build_prop_tab(self):
+        """Fill in the build.prop tab."""
+        buf = io.StringIO()
         
         if "build_prop" in self.profile_data:
             build_props = self.profile_data["build_prop"]
-            build_text.setText("\n".join([f"{k}={v}" for k, v in build_props.items()]))
+            buf.writelines(f"{k}={v}\n" for k, v in build_props.items())
             
-        build_layout.addWidget(build_text)
-        tabs.addTab(build_tab, "Build Properties")
+        self.build_text.setPlainText(buf.getvalue())
         
-        # Hardware tab
-        hardware_tab = QWidget()
-        hardware_layout = QFormLayout(hardware_tab)
+    def _load_hardware_tab(self):
+        """Fill in the hardware tab."""
+        rows = dict.fromkeys(self._hardware_labels)
         
         # CPU info
         if "cpu" in self.profile_data:
             cpu = self.profile_data["cpu"]
-            hardware_layout.addRow("CPU Processors:", QLabel(str(cpu.get("processors", "Unknown"))))
-            hardware_layout.addRow("CPU Architecture:", QLabel(cpu.get("architecture", "Unknown")))
-            hardware_layout.addRow("CPU Features:", QLabel(", ".join(cpu.get("features", []))))
+            rows["cpu_processors"] = str(cpu.get("processors", "Unknown"))
+            rows["cpu_architecture"] = cpu.get("architecture", "Unknown")
+            rows["cpu_features"] = ", ".join(cpu.get("features", []))
             
         # GPU info
         if "gpu" in self.profile_data:
             gpu = self.profile_data["gpu"]
-            hardware_layout.addRow("GPU Vendor:", QLabel(gpu.get("vendor", "Unknown")))
-            hardware_layout.addRow("GPU Renderer:", QLabel(gpu.get("renderer", "Unknown")))
-            hardware_layout.addRow("GPU Version:", QLabel(gpu.get("version", "Unknown")))
+            rows["gpu_vendor"] = gpu.get("vendor", "Unknown")
+            rows["gpu_renderer"] = gpu.get("renderer", "Unknown")
+            rows["gpu_version"] = gpu.get("version", "Unknown")
             
         # Screen info
         if "screen" in self.profile_data:
             screen = self.profile_data["screen"]
-            hardware_layout.addRow("Screen Resolution:", QLabel(f"{screen.get('width', 0)}x{screen.get('height', 0)}"))
-            hardware_layout.addRow("Screen Density:", QLabel(f"{screen.get('density', 0)} dpi"))
-            hardware_layout.addRow("Refresh Rate:", QLabel(f"{screen.get('refresh_rate', 60)} Hz"))
+            rows["screen_resolution"] = f"{screen.get('width', 0)}x{screen.get('height', 0)}"
+            rows["screen_density"] = f"{screen.get('density', 0)} dpi"
+            rows["screen_refresh_rate"] = f"{screen.get('refresh_rate', 60)} Hz"
             
-        tabs.addTab(hardware_tab, "Hardware")
-        
-        # Sensors tab
-        sensors_tab = QWidget()
-        sensors_layout = QVBoxLayout(sensors_tab)
-        
-        sensors_text = QTextEdit()
-        sensors_text.setReadOnly(True)
+        for key, text in rows.items():
+            self._set_row(self._hardware_layout, self._hardware_labels[key], text)
+            
+    def _load_sensors_tab(self):
+        """Fill in the sensors tab."""
+        buf = io.StringIO()
         
         if "sensors" in self.profile_data:
             sensors = self.profile_data["sensors"]
-            sensors_info = []
             
             for sensor_type, sensor_data in sensors.items():
-                sensors_info.append(f"--- {sensor_type.upper()} ---")
-                for key, value in sensor_data.items():
-                    sensors_info.append(f"{key}: {value}")
-                sensors_info.append("")
+                buf.write(f"--- {sensor_type.upper()} ---\n")
+                buf.writelines(f"{key}: {value}\n" for key, value in sensor_data.items())
+                buf.write("\n")
                 
-            sensors_text.setText("\n".join(sensors_info))
-            
-        sensors_layout.addWidget(sensors_text)
-        tabs.addTab(sensors_tab, "Sensors")
-        
-        # Add the tabs to the layout
-        layout.addWidget(tabs)
-        
-        # Add a close button
-        close_button = QPushButton("Close")
-        close_button.clicked.connect(self.accept)
-        
-        layout.addWidget(close_button)
+        self.sensors_text.setPlainText(buf.getvalue())
 
 class DeviceProfileWidget(QWidget):
     """Widget for managing device profiles."""
@@ -144,6 +322,15 @@ class DeviceProfileWidget(QWidget):
         
         self.profile_db = DeviceProfileDatabase()
         
+        # Maps profile names to their row in the profile list
+        self._row_by_name = {}
+        
+        # Name of the last profile announced via profile_selected
+        self._last_emitted = None
+        
+        # Details dialog, created on first use and reused afterwards
+        self._details_dialog = None
+        
         self.init_ui()
         self.update_profile_list()
         
@@ -157,6 +344,9 @@ class DeviceProfileWidget(QWidget):
         
         self.profile_list = QListWidget()
         self.profile_list.setSelectionMode(QListWidget.SingleSelection)
+        self.profile_list.setUniformItemSizes(True)
+        self.profile_list.setLayoutMode(QListWidget.Batched)
+        self.profile_list.setBatchSize(100)
         self.profile_list.itemSelectionChanged.connect(self.on_profile_selected)
         
         profiles_layout.addWidget(self.profile_list)
@@ -219,28 +409,46 @@ class DeviceProfileWidget(QWidget):
         
     def update_profile_list(self):
         """Update the list of available profiles."""
-        self.profile_list.clear()
-        
         profile_names = self.profile_db.get_profile_names()
-        
+
+        # Build all items up front so the view only repaints once
+        items = []
         for name in profile_names:
             profile = self.profile_db.get_profile(name)
             if profile:
                 item = QListWidgetItem()
                 item.setText(f"{profile['manufacturer']} {profile['model']} (Android {profile['android_version']})")
                 item.setData(Qt.UserRole, name)
+                items.append(item)
+
+        self.profile_list.setUpdatesEnabled(False)
+        self.profile_list.blockSignals(True)
+        try:
+            self.profile_list.clear()
+            for item in items:
                 self.profile_list.addItem(item)
-                
+            self._row_by_name = {item.data(Qt.UserRole): row for row, item in enumerate(items)}
+            self._last_emitted = None
+        finally:
+            self.profile_list.blockSignals(False)
+            self.profile_list.setUpdatesEnabled(True)
+
+    @pyqtSlot()
     def on_profile_selected(self):
         """Handle profile selection in the list."""
         items = self.profile_list.selectedItems()
         if items:
             profile_name = items[0].data(Qt.UserRole)
+            if profile_name == self._last_emitted:
+                return
+                
             profile = self.profile_db.get_profile(profile_name)
             
             if profile:
+                self._last_emitted = profile_name
                 self.profile_selected.emit(profile)
                 
+    @pyqtSlot()
     def view_profile_details(self):
         """View detailed information for the selected profile."""
         items = self.profile_list.selectedItems()
@@ -249,9 +457,13 @@ class DeviceProfileWidget(QWidget):
             profile = self.profile_db.get_profile(profile_name)
             
             if profile:
-                dialog = ProfileDetailsDialog(profile, self)
-                dialog.exec_()
+                if self._details_dialog is None:
+                    self._details_dialog = ProfileDetailsDialog(profile, self)
+                else:
+                    self._details_dialog.load(profile)
+                self._details_dialog.exec_()
                 
+    @pyqtSlot()
     def import_profile(self):
         """Import a device profile from a JSON file."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -262,48 +474,58 @@ class DeviceProfileWidget(QWidget):
         )
         
         if file_path:
-            try:
-                with open(file_path, "r") as f:
-                    profile_data = json.load(f)
-                    
-                # Validate minimum required fields
-                required_fields = ['manufacturer', 'model', 'android_version']
-                missing_fields = [field for field in required_fields if field not in profile_data]
+            run_in_background(
+                _read_profile_file,
+                file_path,
+                on_finished=self._on_import_loaded,
+                on_failed=self._on_import_failed
+            )
+            
+    def _on_import_loaded(self, profile_data):
+        """Validate and save a profile loaded by import_profile."""
+        try:
+            # Validate minimum required fields
+            missing_fields = sorted(_REQUIRED_IMPORT_FIELDS - profile_data.keys())
+            
+            if missing_fields:
+                QMessageBox.warning(
+                    self,
+                    "Invalid Profile",
+                    f"The profile is missing required fields: {', '.join(missing_fields)}"
+                )
+                return
                 
-                if missing_fields:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Profile",
-                        f"The profile is missing required fields: {', '.join(missing_fields)}"
-                    )
-                    return
-                    
-                # Generate a name for the profile
-                name = f"{profile_data['manufacturer']}_{profile_data['model']}".lower().replace(' ', '_')
+            # Generate a name for the profile
+            name = f"{profile_data['manufacturer']}_{profile_data['model']}".lower().replace(' ', '_')
+            
+            # Save the profile
+            if self.profile_db.create_profile(name, profile_data):
+                QMessageBox.information(
+                    self,
+                    "Profile Imported",
+                    f"Imported profile: {profile_data['manufacturer']} {profile_data['model']}"
+                )
                 
-                # Save the profile
-                if self.profile_db.create_profile(name, profile_data):
-                    QMessageBox.information(
-                        self,
-                        "Profile Imported",
-                        f"Imported profile: {profile_data['manufacturer']} {profile_data['model']}"
-                    )
-                    
-                    self.update_profile_list()
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Import Error",
-                        "Failed to save the imported profile. It may already exist."
-                    )
-                    
-            except Exception as e:
+                self.update_profile_list()
+            else:
                 QMessageBox.warning(
                     self,
                     "Import Error",
-                    f"Failed to import the profile: {str(e)}"
+                    "Failed to save the imported profile. It may already exist."
                 )
                 
+        except Exception as e:
+            self._on_import_failed(str(e))
+            
+    def _on_import_failed(self, error):
+        """Report a failed profile import."""
+        QMessageBox.warning(
+            self,
+            "Import Error",
+            f"Failed to import the profile: {error}"
+        )
+        
+    @pyqtSlot()
     def export_selected_profile(self):
         """Export the selected profile to a JSON file."""
         items = self.profile_list.selectedItems()
@@ -320,23 +542,31 @@ class DeviceProfileWidget(QWidget):
                 )
                 
                 if file_path:
-                    try:
-                        with open(file_path, "w") as f:
-                            json.dump(profile, f, indent=2)
-                            
-                        QMessageBox.information(
-                            self,
-                            "Profile Exported",
-                            f"Exported profile to: {file_path}"
-                        )
-                        
-                    except Exception as e:
-                        QMessageBox.warning(
-                            self,
-                            "Export Error",
-                            f"Failed to export the profile: {str(e)}"
-                        )
-                        
+                    run_in_background(
+                        _write_profile_file,
+                        file_path,
+                        profile,
+                        on_finished=self._on_export_finished,
+                        on_failed=self._on_export_failed
+                    )
+                    
+    def _on_export_finished(self, file_path):
+        """Report a completed profile export."""
+        QMessageBox.information(
+            self,
+            "Profile Exported",
+            f"Exported profile to: {file_path}"
+        )
+        
+    def _on_export_failed(self, error):
+        """Report a failed profile export."""
+        QMessageBox.warning(
+            self,
+            "Export Error",
+            f"Failed to export the profile: {error}"
+        )
+        
+    @pyqtSlot()
     def delete_selected_profile(self):
         """Delete the selected profile."""
         items = self.profile_list.selectedItems()
@@ -363,6 +593,7 @@ class DeviceProfileWidget(QWidget):
                         "Failed to delete the profile. See the logs for details."
                     )
                     
+    @pyqtSlot()
     def create_custom_profile(self):
         """Create a custom device profile."""
         manufacturer = self.manufacturer_input.text().strip()
@@ -377,97 +608,34 @@ class DeviceProfileWidget(QWidget):
             )
             return
             
+        # Derive the identifiers shared by several profile fields once
+        model_slug = model.lower().replace(' ', '_')
+        manufacturer_lc = manufacturer.lower()
+        build_id = f"QP1A.{android_version}0101.001"
+
         # Generate a basic profile
         profile = {
             "manufacturer": manufacturer,
             "model": model,
-            "brand": manufacturer.lower(),
-            "product": model.lower().replace(' ', '_'),
-            "device": model.lower().replace(' ', '_'),
-            "board": model.lower().replace(' ', '_'),
-            "hardware": model.lower().replace(' ', '_'),
-            "platform": model.lower().replace(' ', '_'),
+            "brand": manufacturer_lc,
+            "product": model_slug,
+            "device": model_slug,
+            "board": model_slug,
+            "hardware": model_slug,
+            "platform": model_slug,
             "android_version": android_version,
             "sdk": str(21 + int(float(android_version))),  # Approximate SDK from version
-            "build_id": f"QP1A.{android_version}0101.001",
-            "fingerprint": f"{manufacturer.lower()}/{model.lower().replace(' ', '_')}/{model.lower().replace(' ', '_')}:{android_version}/QP1A.{android_version}0101.001:user/release-keys",
+            "build_id": build_id,
+            "fingerprint": f"{manufacturer_lc}/{model_slug}/{model_slug}:{android_version}/{build_id}:user/release-keys",
             "build_time": "1609459200000",  # January 1, 2021
             "security_patch": "2021-01-01",
-            "build_description": f"{model.lower().replace(' ', '_')}-user {android_version} QP1A.{android_version}0101.001 release-keys",
-            "sensors": {
-                "accelerometer": {
-                    "name": "BMI160 Accelerometer",
-                    "vendor": "Bosch",
-                    "resolution": 0.0012,
-                    "max_range": 39.2266,
-                    "power": 0.13,
-                    "min_delay": 10000
-                },
-                "gyroscope": {
-                    "name": "BMI160 Gyroscope",
-                    "vendor": "Bosch",
-                    "resolution": 0.001,
-                    "max_range": 34.906586,
-                    "power": 0.13,
-                    "min_delay": 10000
-                },
-                "magnetometer": {
-                    "name": "AK09915 Magnetometer",
-                    "vendor": "AKM",
-                    "resolution": 0.15,
-                    "max_range": 4912,
-                    "power": 0.1,
-                    "min_delay": 10000
-                },
-                "light": {
-                    "name": "TSL2540 Light sensor",
-                    "vendor": "AMS",
-                    "resolution": 1.0,
-                    "max_range": 65535,
-                    "power": 0.1,
-                    "min_delay": 0
-                },
-                "proximity": {
-                    "name": "TSL2540 Proximity sensor",
-                    "vendor": "AMS",
-                    "resolution": 1.0,
-                    "max_range": 5,
-                    "power": 0.1,
-                    "min_delay": 0
-                }
-            },
-            "cpu": {
-                "processors": 8,
-                "architecture": "arm64-v8a",
-                "features": ["neon", "aes", "pmull", "sha1", "sha2", "crc32"],
-                "governor": "schedutil",
-                "min_freq": 300000,
-                "max_freq": 2400000,
-                "abi_list": ["arm64-v8a", "armeabi-v7a", "armeabi"]
-            },
-            "gpu": {
-                "vendor": "Qualcomm",
-                "renderer": "Adreno 650",
-                "version": "OpenGL ES 3.2",
-                "extensions": []
-            },
-            "battery": {
-                "capacity": 4000,
-                "technology": "Li-ion"
-            },
-            "screen": {
-                "density": 420,
-                "width": 1080,
-                "height": 2340,
-                "refresh_rate": 60,
-                "sizeCategory": 4
-            },
-            "network": {
-                "imei_prefix": "35291011",
-                "sim_operator": "310260",
-                "cell_operator": "T-Mobile",
-                "network_types": ["LTE", "HSDPA", "HSUPA", "UMTS", "EDGE", "GPRS"]
-            }
+            "build_description": f"{model_slug}-user {android_version} {build_id} release-keys",
+            "sensors": copy.deepcopy(_DEFAULT_SENSORS),
+            "cpu": copy.deepcopy(_DEFAULT_CPU),
+            "gpu": copy.deepcopy(_DEFAULT_GPU),
+            "battery": dict(_DEFAULT_BATTERY),
+            "screen": dict(_DEFAULT_SCREEN),
+            "network": copy.deepcopy(_DEFAULT_NETWORK)
         }
         
         # Generate a name for the profile
@@ -496,24 +664,21 @@ class DeviceProfileWidget(QWidget):
                 "Failed to create the profile. It may already exist."
             )
             
+    @pyqtSlot()
     def select_random_profile(self):
         """Select a random profile from the available profiles."""
-        random_profile = self.profile_db.get_random_profile()
+        random_name = self.profile_db.get_random_profile_name()
+        random_profile = self.profile_db.get_profile(random_name) if random_name else None
         
         if random_profile:
+            self._last_emitted = random_name
             self.profile_selected.emit(random_profile)
             
-            # Find and select the item in the list
-            for i in range(self.profile_list.count()):
-                item = self.profile_list.item(i)
-                profile_name = item.data(Qt.UserRole)
-                profile = self.profile_db.get_profile(profile_name)
+            # Select the matching item in the list
+            row = self._row_by_name.get(random_name)
+            if row is not None:
+                self.profile_list.setCurrentRow(row)
                 
-                if (profile['manufacturer'] == random_profile['manufacturer'] and 
-                    profile['model'] == random_profile['model']):
-                    self.profile_list.setCurrentItem(item)
-                    break
-                    
             # Show a message
             QMessageBox.information(
                 self,
@@ -10,28 +10,39 @@ import logging
 import threading
 import time
 import json
+import queue
+import atexit
+import functools
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 try:
     from PyQt5.QtWidgets import (
         QApplication, QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
         QLabel, QComboBox, QTabWidget, QGroupBox, QFormLayout, QLineEdit,
-        QCheckBox, QFileDialog, QMessageBox, QSlider, QTextEdit, QSplitter,
-        QListWidget, QListWidgetItem, QProgressBar, QSpinBox, QInputDialog
+        QCheckBox, QFileDialog, QMessageBox, QSlider, QSplitter,
+        QListWidget, QListWidgetItem, QProgressBar, QSpinBox, QInputDialog,
+        QPlainTextEdit, QDialog
     )
-    from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
-    from PyQt5.QtGui import QIcon, QPixmap
+    from PyQt5.QtCore import (
+        Qt, QTimer, QThread, QThreadPool, QElapsedTimer, pyqtSignal, pyqtSlot
+    )
+    from PyQt5.QtGui import QIcon, QPixmap, QTextCursor
     USE_PYQT5 = True
 except ImportError:
     try:
         from PySide6.QtWidgets import (
             QApplication, QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
             QLabel, QComboBox, QTabWidget, QGroupBox, QFormLayout, QLineEdit,
-            QCheckBox, QFileDialog, QMessageBox, QSlider, QTextEdit, QSplitter,
-            QListWidget, QListWidgetItem, QProgressBar, QSpinBox, QInputDialog
+            QCheckBox, QFileDialog, QMessageBox, QSlider, QSplitter,
+            QListWidget, QListWidgetItem, QProgressBar, QSpinBox, QInputDialog,
+            QPlainTextEdit, QDialog
+        )
+        from PySide6.QtCore import (
+            Qt, QTimer, QThread, QThreadPool, QElapsedTimer, Signal as pyqtSignal,
+            Slot as pyqtSlot
         )
-        from PySide6.QtCore import Qt, QTimer, Signal as pyqtSignal, QObject
-        from PySide6.QtGui import QIcon, QPixmap
+        from PySide6.QtGui import QIcon, QPixmap, QTextCursor
         USE_PYQT5 = False
     except ImportError:
         raise ImportError("Neither PyQt5 nor PySide6 could be imported. Please install one of them.")
@@ -47,12 +58,124 @@ from ..anti_detection.device_profiles import DeviceProfileDatabase
 # Import our custom widgets
 from .image_download_widget import ImageDownloadWidget
 from .device_profile_widget import DeviceProfileWidget
+from .workers import ProcessMonitor, run_in_background
 
 logger = logging.getLogger(__name__)
 
+# Bundled Frida scripts, next to the anti_detection modules
+_FRIDA_SCRIPTS_DIR = str(Path(__file__).resolve().parents[1] / "anti_detection" / "frida_scripts")
+
+# Entries of the anti-detection methods list
+_ANTI_DETECTION_METHODS = (
+    "Hardware ID Spoofing",
+    "Build.prop Customization",
+    "Frida API Hooking",
+    "Virtualization Masking",
+    "Sensor Data Simulation",
+    "Network Traffic Normalization",
+    "Touch Input Randomization",
+    "Camera API Spoofing",
+)
+
+class LogFormatter(logging.Formatter):
+    """Formatter for the log view that reuses the timestamp within a second.
+    
+    Produces the same text as '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+    without going through the generic format-string path for plain records.
+    """
+    
+    def __init__(self):
+        """Initialize the formatter with an empty timestamp cache."""
+        super().__init__('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+        self._cached_sec = None
+        self._cached_time = ""
+        
+    def formatTime(self, record, datefmt=None):
+        """Format the record time, rebuilding the date part only when the second changes."""
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_sec = sec
+            self._cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+            
+        return self.default_msec_format % (self._cached_time, record.msecs)
+        
+    def format(self, record):
+        """Format a record; records with exception or stack info use the base path."""
+        if record.exc_info or record.stack_info:
+            return super().format(record)
+            
+        return f"{self.formatTime(record)} [{record.levelname}] {record.name}: {record.getMessage()}"
+        
+class LogHandler(logging.Handler):
+    """Logging handler that forwards formatted records through a Qt signal.
+    
+    Records are buffered and emitted in batches, either FLUSH_INTERVAL
+    seconds after the first buffered record or as soon as MAX_BUFFERED
+    records are waiting. One long-lived flusher thread handles the timed
+    flushes.
+    """
+    
+    FLUSH_INTERVAL = 0.05
+    MAX_BUFFERED = 500
+    
+    def __init__(self, signal):
+        """Initialize the handler with the signal to emit batches on."""
+        super().__init__()
+        self.signal = signal
+        self.setFormatter(LogFormatter())
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="LogHandlerFlusher", daemon=True)
+        self._flusher.start()
+        
+    def emit(self, record):
+        """Buffer a formatted record and wake the flusher."""
+        msg = self.format(record)
+        
+        with self._buffer_lock:
+            self._buffer.append(msg)
+            full = len(self._buffer) >= self.MAX_BUFFERED
+            
+        if full:
+            self.flush()
+        else:
+            self._pending.set()
+            
+    def _flush_loop(self):
+        """Flush the buffer FLUSH_INTERVAL seconds after records arrive."""
+        while not self._closed:
+            self._pending.wait()
+            time.sleep(self.FLUSH_INTERVAL)
+            self._pending.clear()
+            self.flush()
+            
+    def flush(self):
+        """Emit all buffered records as one batch; the signal is queued to the UI thread."""
+        with self._buffer_lock:
+            batch, self._buffer = self._buffer, []
+            
+        if batch:
+            self.signal.emit(batch)
+            
+    def close(self):
+        """Flush the remaining records and stop the flusher thread."""
+        self._closed = True
+        self._pending.set()
+        self.flush()
+        super().close()
+
 class EmulatorGUI(QMainWindow):
     """Main GUI window for the undetected Android emulator."""
     
+    # Signal carrying batches of formatted log records to the log view
+    log_signal = pyqtSignal(list)
+    
+    # Signals starting and stopping the QEMU monitor in its own thread
+    start_qemu_monitor = pyqtSignal()
+    stop_qemu_monitor = pyqtSignal()
+    
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -65,17 +188,36 @@ class EmulatorGUI(QMainWindow):
         self.qemu = QEMUWrapper()
         self.image_manager = ImageManager()
         self.android_customizer = AndroidCustomizer()
-        self.sensor_simulator = SensorSimulator()
-        self.frida_manager = FridaManager()
         self.device_profile_db = DeviceProfileDatabase()
         
+        # Background tasks share the global thread pool; cap it so disk-heavy
+        # tasks (image creation, imports, log saves) do not thrash each other
+        QThreadPool.globalInstance().setMaxThreadCount(min(4, os.cpu_count() or 2))
+        
+        # Created on first use; both do I/O on construction (profile scan,
+        # Frida device lookup) that would otherwise delay the first paint
+        self._sensor_simulator = None
+        self._frida_manager = None
+        
         # Set up the UI
         self.init_ui()
         
-        # Setup timers for updates
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(1000)  # Update every second
+        # Setup timers for updates; the status timer only runs while the
+        # emulator is running, otherwise the status is refreshed on changes
+        self.status_timer = QTimer(self)
+        self.status_timer.setInterval(1000)  # Update every second
+        self.status_timer.timeout.connect(self._on_status_timer)
+        
+        # Poll QEMU liveness on a background thread so a slow check never
+        # blocks the event loop; polling only runs while the emulator is up
+        self._monitor_thread = QThread(self)
+        self.qemu_monitor = ProcessMonitor(self.qemu.is_alive)
+        self.qemu_monitor.moveToThread(self._monitor_thread)
+        self.start_qemu_monitor.connect(self.qemu_monitor.start, Qt.QueuedConnection)
+        self.stop_qemu_monitor.connect(self.qemu_monitor.stop, Qt.QueuedConnection)
+        self._monitor_thread.finished.connect(self.qemu_monitor.deleteLater)
+        self.qemu_monitor.alive_polled.connect(self.on_qemu_alive_polled)
+        self._monitor_thread.start()
         
         # State variables
         self.emulator_running = False
@@ -84,8 +226,48 @@ class EmulatorGUI(QMainWindow):
         self.selected_device_profile = None
         self.sensor_simulation_active = False
         
+        # Selection labels as shown in the status box
+        self._system_image_name = "None"
+        self._data_image_name = "None"
+        self._profile_name = "None"
+        
+        # Set while QEMU is being started on the thread pool, so the window
+        # is not closed under a launch in progress
+        self._starting = False
+        
+        # Set while QEMU is being stopped on the thread pool, so the monitor
+        # does not report the exit as unexpected
+        self._stopping = False
+        
+        # Uptime of the running emulator; the status text is only rebuilt
+        # when the displayed second changes
+        self._uptime = QElapsedTimer()
+        self._last_shown_sec = -1
+        
+        # Last text shown in the status box; identical updates are skipped
+        self._last_status_text = None
+        
+        # Default directory for file dialogs
+        self._home_dir = str(Path.home())
+        
+        self.update_status()
+        
         logger.info("GUI initialized")
         
+    @property
+    def sensor_simulator(self):
+        """Sensor simulator, created on first access."""
+        if self._sensor_simulator is None:
+            self._sensor_simulator = SensorSimulator()
+        return self._sensor_simulator
+        
+    @property
+    def frida_manager(self):
+        """Frida manager, created on first access."""
+        if self._frida_manager is None:
+            self._frida_manager = FridaManager()
+        return self._frida_manager
+        
     def init_ui(self):
         """Initialize the user interface."""
         # Main widget and layout
@@ -97,13 +279,16 @@ class EmulatorGUI(QMainWindow):
         # Create tab widget for different sections
         self.tabs = QTabWidget()
         
-        # Add tabs
+        # Add tabs; Main and Logs are built up front, the others the first
+        # time they are shown
+        self._tab_builders = {}
         self.tabs.addTab(self.create_main_tab(), "Main")
-        self.tabs.addTab(self.create_images_tab(), "Images")
-        self.tabs.addTab(self.create_profiles_tab(), "Device Profiles")
-        self.tabs.addTab(self.create_detection_tab(), "Anti-Detection")
-        self.tabs.addTab(self.create_settings_tab(), "Settings")
+        self._add_lazy_tab(self.create_images_tab, "Images")
+        self._add_lazy_tab(self.create_profiles_tab, "Device Profiles")
+        self._detection_tab_index = self._add_lazy_tab(self.create_detection_tab, "Anti-Detection")
+        self._settings_tab_index = self._add_lazy_tab(self.create_settings_tab, "Settings")
         self.tabs.addTab(self.create_logs_tab(), "Logs")
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         
         main_layout.addWidget(self.tabs)
         
@@ -111,6 +296,22 @@ class EmulatorGUI(QMainWindow):
         self.status_label = QLabel("Status: Ready")
         main_layout.addWidget(self.status_label)
         
+    def _add_lazy_tab(self, builder, title):
+        """Add a placeholder tab that is filled by builder on first use."""
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        index = self.tabs.addTab(placeholder, title)
+        self._tab_builders[index] = builder
+        return index
+        
+    def _ensure_tab_built(self, index):
+        """Build the tab at index if it is still a placeholder."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).layout().addWidget(builder())
+            
     def create_main_tab(self):
         """Create the main control tab."""
         tab = QWidget()
@@ -170,9 +371,9 @@ class EmulatorGUI(QMainWindow):
         control_layout.addWidget(self.linkedin_mode_checkbox)
         
         # Quick setup button
-        quick_setup_button = QPushButton("Quick Setup (Auto-configure)")
-        quick_setup_button.clicked.connect(self.quick_setup)
-        control_layout.addWidget(quick_setup_button)
+        self.quick_setup_button = QPushButton("Quick Setup (Auto-configure)")
+        self.quick_setup_button.clicked.connect(self.quick_setup)
+        control_layout.addWidget(self.quick_setup_button)
         
         # Add the control group to the tab
         layout.addWidget(control_group)
@@ -181,8 +382,9 @@ class EmulatorGUI(QMainWindow):
         status_group = QGroupBox("Emulator Status")
         status_layout = QVBoxLayout(status_group)
         
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
+        self.status_text.setUndoRedoEnabled(False)
         status_layout.addWidget(self.status_text)
         
         layout.addWidget(status_group)
@@ -223,19 +425,26 @@ class EmulatorGUI(QMainWindow):
         frida_layout = QVBoxLayout(frida_group)
         
         self.script_list = QListWidget()
-        script_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                               "src", "anti_detection", "frida_scripts")
-        
-        if os.path.exists(script_dir):
-            for script_file in os.listdir(script_dir):
-                if script_file.endswith('.js'):
-                    item = QListWidgetItem(script_file)
-                    item.setData(Qt.UserRole, os.path.join(script_dir, script_file))
-                    self.script_list.addItem(item)
-                    
-                    # Select the LinkedIn bypass script by default
-                    if script_file == "linkedin_bypass.js":
-                        self.script_list.setCurrentItem(item)
+        
+        # Names of the listed scripts, for the duplicate check when adding
+        self._script_names = set()
+        if os.path.exists(_FRIDA_SCRIPTS_DIR):
+            # scandir gives the entry type without a stat per file
+            with os.scandir(_FRIDA_SCRIPTS_DIR) as it:
+                entries = sorted(
+                    (entry for entry in it if entry.name.endswith('.js') and entry.is_file()),
+                    key=lambda entry: entry.name
+                )
+                
+            for entry in entries:
+                item = QListWidgetItem(entry.name)
+                item.setData(Qt.UserRole, entry.path)
+                self.script_list.addItem(item)
+                self._script_names.add(entry.name)
+                
+                # Select the LinkedIn bypass script by default
+                if entry.name == "linkedin_bypass.js":
+                    self.script_list.setCurrentItem(item)
         
         frida_layout.addWidget(self.script_list)
         
@@ -281,20 +490,8 @@ class EmulatorGUI(QMainWindow):
         methods_layout = QVBoxLayout(methods_group)
         
         self.methods_list = QListWidget()
-        methods = [
-            "Hardware ID Spoofing", 
-            "Build.prop Customization",
-            "Frida API Hooking",
-            "Virtualization Masking",
-            "Sensor Data Simulation",
-            "Network Traffic Normalization",
-            "Touch Input Randomization",
-            "Camera API Spoofing"
-        ]
-        
-        for method in methods:
-            item = QListWidgetItem()
-            item.setText(method)
+        for method in _ANTI_DETECTION_METHODS:
+            item = QListWidgetItem(method)
             item.setCheckState(Qt.Checked)
             self.methods_list.addItem(item)
             
@@ -345,10 +542,8 @@ class EmulatorGUI(QMainWindow):
         self.vnc_port_spinner.setEnabled(False)
         qemu_layout.addRow("VNC Port:", self.vnc_port_spinner)
         
-        # Connect the VNC checkbox to the port spinner
-        self.enable_vnc_checkbox.stateChanged.connect(
-            lambda state: self.vnc_port_spinner.setEnabled(state == Qt.Checked)
-        )
+        # Connect the VNC checkbox straight to the port spinner's slot
+        self.enable_vnc_checkbox.toggled.connect(self.vnc_port_spinner.setEnabled)
         
         layout.addWidget(qemu_group)
         
@@ -382,31 +577,24 @@ class EmulatorGUI(QMainWindow):
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setLineWrapMode(QTextEdit.NoWrap)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setMaximumBlockCount(5000)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.log_text.setStyleSheet("font-family: monospace;")
         
-        # Create a log handler that updates the log text in a thread-safe way
-        class QTextEditLoggerSignals(QObject):
-            appendPlainText = pyqtSignal(str)
-            
-        class QTextEditLogger(logging.Handler):
-            def __init__(self, text_edit):
-                super().__init__()
-                self.text_edit = text_edit
-                self.signals = QTextEditLoggerSignals()
-                self.signals.appendPlainText.connect(self.text_edit.append)
-                self.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s'))
-                
-            def emit(self, record):
-                msg = self.format(record)
-                # Use signal to safely update the text edit from any thread
-                self.signals.appendPlainText.emit(msg)
-                
-        # Add the handler to the root logger
-        log_handler = QTextEditLogger(self.log_text)
-        logging.getLogger().addHandler(log_handler)
+        # Route log records through a queue; the listener thread formats them
+        # and hands them to the UI thread via log_signal
+        self.log_signal.connect(self.update_log, Qt.QueuedConnection)
+        log_queue = queue.SimpleQueue()
+        self._log_queue_handler = QueueHandler(log_queue)
+        self._log_handler = LogHandler(self.log_signal)
+        self._log_listener = QueueListener(
+            log_queue, self._log_handler, respect_handler_level=True
+        )
+        logging.getLogger().addHandler(self._log_queue_handler)
+        self._log_listener.start()
         
         layout.addWidget(self.log_text)
         
@@ -425,17 +613,57 @@ class EmulatorGUI(QMainWindow):
         
         return tab
         
+    @pyqtSlot(list)
+    def update_log(self, batch):
+        """Append a batch of log messages to the log view.
+        
+        The view only follows the tail if it was already scrolled to the
+        bottom, so reading older lines is not interrupted.
+        """
+        scrollbar = self.log_text.verticalScrollBar()
+        follow_tail = scrollbar.value() == scrollbar.maximum()
+        
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        if not document.isEmpty():
+            cursor.insertBlock()
+        cursor.insertText("\n".join(batch))
+        
+        if follow_tail:
+            scrollbar.setValue(scrollbar.maximum())
+        
+    def _stop_background_threads(self):
+        """Stop the QEMU monitor thread and the UI log listener."""
+        self._monitor_thread.quit()
+        self._monitor_thread.wait()
+        
+        logging.getLogger().removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
+        self._log_handler.close()
+        
+    def _on_status_timer(self):
+        """Refresh the status once per uptime second."""
+        if self._uptime.elapsed() // 1000 != self._last_shown_sec:
+            self.update_status()
+            
     def update_status(self):
         """Update the status displays."""
         if self.emulator_running:
+            sec = self._uptime.elapsed() // 1000
+            self._last_shown_sec = sec
+            m, s = divmod(sec, 60)
+            h, m = divmod(m, 60)
+            
             self.status_label.setText("Status: Emulator Running")
             
             # Update status text with more details
             status_info = [
                 f"Emulator Status: Running",
-                f"System Image: {os.path.basename(self.selected_system_image) if self.selected_system_image else 'None'}",
-                f"Data Image: {os.path.basename(self.selected_data_image) if self.selected_data_image else 'None'}",
-                f"Device Profile: {self.selected_device_profile['manufacturer'] + ' ' + self.selected_device_profile['model'] if self.selected_device_profile else 'None'}",
+                f"Uptime: {h}:{m:02d}:{s:02d}",
+                f"System Image: {self._system_image_name}",
+                f"Data Image: {self._data_image_name}",
+                f"Device Profile: {self._profile_name}",
                 f"Memory: {self.memory_spinner.value()} MB",
                 f"CPU Cores: {self.cores_spinner.value()}",
                 f"Sensor Simulation: {'Active' if self.sensor_simulation_active else 'Inactive'}",
@@ -443,7 +671,7 @@ class EmulatorGUI(QMainWindow):
                 f"LinkedIn Mode: {'Enabled' if self.linkedin_mode_checkbox.isChecked() else 'Disabled'}"
             ]
             
-            self.status_text.setText("\n".join(status_info))
+            text = "\n".join(status_info)
         else:
             self.status_label.setText("Status: Ready")
             
@@ -451,26 +679,52 @@ class EmulatorGUI(QMainWindow):
             if self.selected_system_image or self.selected_device_profile:
                 config_info = [
                     f"Emulator Status: Stopped",
-                    f"System Image: {os.path.basename(self.selected_system_image) if self.selected_system_image else 'None'}",
-                    f"Data Image: {os.path.basename(self.selected_data_image) if self.selected_data_image else 'None'}",
-                    f"Device Profile: {self.selected_device_profile['manufacturer'] + ' ' + self.selected_device_profile['model'] if self.selected_device_profile else 'None'}"
+                    f"System Image: {self._system_image_name}",
+                    f"Data Image: {self._data_image_name}",
+                    f"Device Profile: {self._profile_name}"
                 ]
-                self.status_text.setText("\n".join(config_info))
+                text = "\n".join(config_info)
             else:
-                self.status_text.setText("Emulator not configured. Please select a system image and device profile.")
-    
+                text = "Emulator not configured. Please select a system image and device profile."
+                
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status_text.setPlainText(text)
+            
+    def on_qemu_alive_polled(self, alive):
+        """Handle a liveness result from the QEMU monitor thread."""
+        if alive or not self.emulator_running or self._stopping:
+            return
+        if not self.qemu.reap():
+            return
+            
+        logger.warning("QEMU process exited unexpectedly")
+        
+        self._stop_instrumentation()
+        
+        self.emulator_running = False
+        self.stop_qemu_monitor.emit()
+        self.status_timer.stop()
+        self.start_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
+        self.update_status()
+        
     def on_system_image_selected(self, image_info):
         """Handle system image selection."""
         # Store the path from the image info dictionary
         self.selected_system_image = image_info['path']
+        self._system_image_name = image_info['filename']
         self.system_image_label.setText(image_info['filename'])
-        logger.info(f"Selected system image: {image_info['filename']}")
+        logger.info("Selected system image: %s", image_info['filename'])
+        self.update_status()
         
     def on_device_profile_selected(self, profile):
         """Handle device profile selection."""
         self.selected_device_profile = profile
-        self.device_profile_label.setText(f"{profile['manufacturer']} {profile['model']}")
-        logger.info(f"Selected device profile: {profile['manufacturer']} {profile['model']}")
+        self._profile_name = f"{profile['manufacturer']} {profile['model']}"
+        self.device_profile_label.setText(self._profile_name)
+        logger.info("Selected device profile: %s %s", profile['manufacturer'], profile['model'])
+        self.update_status()
         
     def browse_qemu_path(self):
         """Browse for QEMU executable."""
@@ -540,66 +794,78 @@ class EmulatorGUI(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Logs",
-            os.path.join(os.path.expanduser("~"), "emulator_logs.txt"),
+            os.path.join(self._home_dir, "emulator_logs.txt"),
             "Text Files (*.txt);;All Files (*)"
         )
         
         if file_path:
-            try:
-                with open(file_path, "w") as f:
-                    f.write(self.log_text.toPlainText())
-                    
-                logger.info(f"Logs saved to {file_path}")
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "Error Saving Logs",
-                    f"Failed to save logs: {str(e)}"
-                )
+            # The document is read on the UI thread; the write runs on the
+            # thread pool
+            run_in_background(
+                Path(file_path).write_text,
+                self.log_text.toPlainText(),
+                on_finished=lambda _: logger.info("Logs saved to %s", file_path),
+                on_failed=self._on_save_logs_failed
+            )
+            
+    def _on_save_logs_failed(self, error):
+        """Report logs that could not be saved."""
+        QMessageBox.warning(
+            self,
+            "Error Saving Logs",
+            f"Failed to save logs: {error}"
+        )
                 
     def view_frida_script(self):
-        """View the selected Frida script."""
+        """View the selected Frida script; the file is read on the thread pool."""
         items = self.script_list.selectedItems()
         if items:
             script_path = items[0].data(Qt.UserRole)
+            run_in_background(
+                Path(script_path).read_text,
+                on_finished=functools.partial(self._show_frida_script, items[0].text()),
+                on_failed=self._on_frida_script_read_failed,
+                priority=1
+            )
             
-            try:
-                with open(script_path, "r") as f:
-                    script_content = f.read()
-                    
-                # Create a dialog to show the script
-                dialog = QDialog(self)
-                dialog.setWindowTitle(f"Frida Script: {items[0].text()}")
-                dialog.resize(800, 600)
-                
-                layout = QVBoxLayout(dialog)
-                
-                script_text = QTextEdit()
-                script_text.setReadOnly(True)
-                script_text.setLineWrapMode(QTextEdit.NoWrap)
-                script_text.setStyleSheet("font-family: monospace;")
-                script_text.setText(script_content)
-                
-                layout.addWidget(script_text)
-                
-                close_button = QPushButton("Close")
-                close_button.clicked.connect(dialog.accept)
-                layout.addWidget(close_button)
-                
-                dialog.exec_()
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "Error Reading Script",
-                    f"Failed to read script: {str(e)}"
-                )
+    def _show_frida_script(self, script_name, script_content):
+        """Show the content of a Frida script in a dialog."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Frida Script: {script_name}")
+        dialog.resize(800, 600)
+        
+        layout = QVBoxLayout(dialog)
+        
+        # Scripts are shown as plain text; JavaScript must not be parsed as HTML
+        script_text = QPlainTextEdit()
+        script_text.setReadOnly(True)
+        script_text.setUndoRedoEnabled(False)
+        script_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        script_text.setStyleSheet("font-family: monospace;")
+        script_text.setPlainText(script_content)
+        
+        layout.addWidget(script_text)
+        
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(dialog.accept)
+        layout.addWidget(close_button)
+        
+        dialog.exec_()
+        
+    def _on_frida_script_read_failed(self, error):
+        """Report a Frida script that could not be read."""
+        QMessageBox.warning(
+            self,
+            "Error Reading Script",
+            f"Failed to read script: {error}"
+        )
                 
     def add_frida_script(self):
         """Add a custom Frida script."""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Frida Script",
-            str(Path.home()),
+            self._home_dir,
             "JavaScript Files (*.js);;All Files (*)"
         )
         
@@ -607,21 +873,21 @@ class EmulatorGUI(QMainWindow):
             script_name = os.path.basename(file_path)
             
             # Check if script with same name already exists
-            for i in range(self.script_list.count()):
-                if self.script_list.item(i).text() == script_name:
-                    QMessageBox.warning(
-                        self,
-                        "Script Already Exists",
-                        f"A script with the name '{script_name}' already exists."
-                    )
-                    return
-                    
+            if script_name in self._script_names:
+                QMessageBox.warning(
+                    self,
+                    "Script Already Exists",
+                    f"A script with the name '{script_name}' already exists."
+                )
+                return
+                
             # Add to the list
             item = QListWidgetItem(script_name)
             item.setData(Qt.UserRole, file_path)
             self.script_list.addItem(item)
+            self._script_names.add(script_name)
             
-            logger.info(f"Added custom Frida script: {file_path}")
+            logger.info("Added custom Frida script: %s", file_path)
             
     def quick_setup(self):
         """Perform quick setup with automatic configuration."""
@@ -630,8 +896,9 @@ class EmulatorGUI(QMainWindow):
             available_images = self.image_manager.get_available_images()
             if available_images:
                 self.selected_system_image = available_images[0]['path']
-                self.system_image_label.setText(os.path.basename(self.selected_system_image))
-                logger.info(f"Auto-selected system image: {self.selected_system_image}")
+                self._system_image_name = available_images[0]['filename']
+                self.system_image_label.setText(self._system_image_name)
+                logger.info("Auto-selected system image: %s", self.selected_system_image)
             else:
                 QMessageBox.warning(
                     self,
@@ -641,21 +908,19 @@ class EmulatorGUI(QMainWindow):
                 self.tabs.setCurrentIndex(1)  # Switch to Images tab
                 return
                 
-        # Create a data image if not selected
-        if not self.selected_data_image:
-            self.selected_data_image = self.image_manager.create_empty_image("auto_data", size_gb=8)
-            if self.selected_data_image:
-                self.data_image_label.setText(os.path.basename(self.selected_data_image))
-                logger.info(f"Created data image: {self.selected_data_image}")
-                
         # Select a device profile if not selected
         if not self.selected_device_profile:
             self.selected_device_profile = self.device_profile_db.get_random_profile()
             if self.selected_device_profile:
-                self.device_profile_label.setText(
+                self._profile_name = (
                     f"{self.selected_device_profile['manufacturer']} {self.selected_device_profile['model']}"
                 )
-                logger.info(f"Auto-selected device profile: {self.selected_device_profile['manufacturer']} {self.selected_device_profile['model']}")
+                self.device_profile_label.setText(self._profile_name)
+                logger.info(
+                    "Auto-selected device profile: %s %s",
+                    self.selected_device_profile['manufacturer'],
+                    self.selected_device_profile['model']
+                )
             else:
                 QMessageBox.warning(
                     self,
@@ -672,6 +937,44 @@ class EmulatorGUI(QMainWindow):
         # Enable LinkedIn mode
         self.linkedin_mode_checkbox.setChecked(True)
         
+        # Create a data image if not selected; qemu-img runs on the thread
+        # pool and setup finishes when it is done
+        if not self.selected_data_image:
+            self.quick_setup_button.setEnabled(False)
+            self.status_label.setText("Status: Creating data image...")
+            run_in_background(
+                self.image_manager.create_empty_image,
+                "auto_data",
+                size_gb=8,
+                on_finished=self._on_quick_setup_data_image,
+                on_failed=self._on_quick_setup_data_image_failed,
+                priority=-1
+            )
+            return
+            
+        self._finish_quick_setup()
+        
+    def _on_quick_setup_data_image(self, image_path):
+        """Select the data image created by quick setup and finish the setup."""
+        self.quick_setup_button.setEnabled(True)
+        if image_path:
+            self.selected_data_image = image_path
+            self._data_image_name = os.path.basename(self.selected_data_image)
+            self.data_image_label.setText(self._data_image_name)
+            logger.info("Created data image: %s", self.selected_data_image)
+            
+        self._finish_quick_setup()
+        
+    def _on_quick_setup_data_image_failed(self, error):
+        """Finish quick setup without a data image."""
+        logger.error("Failed to create data image: %s", error)
+        self.quick_setup_button.setEnabled(True)
+        self._finish_quick_setup()
+        
+    def _finish_quick_setup(self):
+        """Refresh the status and confirm the quick setup."""
+        self.update_status()
+        
         # Show confirmation
         QMessageBox.information(
             self,
@@ -690,23 +993,30 @@ class EmulatorGUI(QMainWindow):
             )
             return
             
+        # The launch options live on the detection and settings tabs
+        self._ensure_tab_built(self._detection_tab_index)
+        self._ensure_tab_built(self._settings_tab_index)
+        
         # Configure QEMU
-        self.qemu.set_param("cdrom", self.selected_system_image)
+        params = {
+            "cdrom": self.selected_system_image,
+            "memory": str(self.memory_spinner.value()),
+            "smp": str(self.cores_spinner.value()),
+        }
         
         if self.selected_data_image:
-            self.qemu.set_param("hda", self.selected_data_image)
+            params["hda"] = self.selected_data_image
             
-        self.qemu.set_param("memory", str(self.memory_spinner.value()))
-        self.qemu.set_param("smp", str(self.cores_spinner.value()))
-        
         # KVM acceleration if enabled
         if self.enable_kvm_checkbox.isChecked():
-            self.qemu.set_param("enable-kvm", "")
+            params["enable-kvm"] = ""
             
         # VNC server if enabled
         if self.enable_vnc_checkbox.isChecked():
-            self.qemu.set_param("vnc", f":{self.vnc_port_spinner.value() - 5900}")
+            params["vnc"] = f":{self.vnc_port_spinner.value() - 5900}"
             
+        self.qemu.update_params(params)
+        
         # Apply device profile if selected
         if self.selected_device_profile:
             # Configure sensor simulation
@@ -732,12 +1042,28 @@ class EmulatorGUI(QMainWindow):
                     }
                     logger.info("Configured sensor simulation from device profile")
             
-        # Start the emulator
-        if self.qemu.start():
+        # Start the emulator on the thread pool; the buttons stay disabled
+        # until it reports back
+        self._starting = True
+        self.start_button.setEnabled(False)
+        run_in_background(
+            self.qemu.start,
+            on_finished=self._on_emulator_started,
+            on_failed=self._on_emulator_start_failed,
+            priority=1
+        )
+        
+    def _on_emulator_started(self, started):
+        """Finish starting the emulator once QEMU has been launched."""
+        self._starting = False
+        if started:
             logger.info("Emulator started successfully")
             
             self.emulator_running = True
-            self.start_button.setEnabled(False)
+            self._uptime.start()
+            self._last_shown_sec = -1
+            self.status_timer.start()
+            self.start_qemu_monitor.emit()
             self.stop_button.setEnabled(True)
             
             # Start sensor simulation if enabled
@@ -776,23 +1102,48 @@ class EmulatorGUI(QMainWindow):
                             self.frida_manager.set_target_package(target_app)
                             # Only log success if start_monitoring actually succeeds
                             if self.frida_manager.start_monitoring():
-                                logger.info(f"Frida monitoring started for {target_app}")
+                                logger.info("Frida monitoring started for %s", target_app)
                             # The warning is already logged in the frida_manager.start_monitoring method
                         else:
                             logger.warning("Frida monitoring not available in this version")
                     except Exception as e:
-                        logger.error(f"Error loading Frida script: {e}")
+                        logger.error("Error loading Frida script: %s", e)
         else:
+            self.start_button.setEnabled(True)
             QMessageBox.critical(
                 self,
                 "Emulator Start Failed",
                 "Failed to start the emulator. Check the logs for details."
             )
             
+    def _on_emulator_start_failed(self, error):
+        """Restore the UI when starting QEMU raised an error."""
+        logger.error("Error starting emulator: %s", error)
+        self._starting = False
+        self.start_button.setEnabled(True)
+        QMessageBox.critical(
+            self,
+            "Emulator Start Failed",
+            f"Failed to start the emulator: {error}"
+        )
+            
     def stop_emulator(self):
-        """Stop the running emulator."""
-        # Stop Frida injection
-        if self.frida_manager.is_monitoring:
+        """Stop the running emulator; QEMU is stopped on the thread pool."""
+        self._stop_instrumentation()
+        
+        self._stopping = True
+        self.stop_button.setEnabled(False)
+        run_in_background(
+            self.qemu.stop,
+            on_finished=self._on_emulator_stopped,
+            on_failed=self._on_emulator_stop_failed,
+            priority=1
+        )
+        
+    def _stop_instrumentation(self):
+        """Stop Frida monitoring and sensor simulation."""
+        # Stop Frida injection; skip it if Frida was never used
+        if getattr(self._frida_manager, "is_monitoring", False):
             self.frida_manager.stop_monitoring()
             logger.info("Stopped Frida monitoring")
             
@@ -802,23 +1153,49 @@ class EmulatorGUI(QMainWindow):
             self.sensor_simulation_active = False
             logger.info("Stopped sensor simulation")
             
-        # Stop QEMU
-        if self.qemu.stop():
+    def _on_emulator_stopped(self, stopped):
+        """Update the UI once QEMU has been stopped."""
+        self._stopping = False
+        if stopped:
             logger.info("Emulator stopped")
             
             self.emulator_running = False
+            self.stop_qemu_monitor.emit()
+            self.status_timer.stop()
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
+            self.update_status()
         else:
+            self.stop_button.setEnabled(True)
             QMessageBox.warning(
                 self,
                 "Stop Failed",
                 "Failed to stop the emulator gracefully. It may still be running."
             )
             
+    def _on_emulator_stop_failed(self, error):
+        """Restore the UI when stopping QEMU raised an error."""
+        logger.error("Error stopping emulator: %s", error)
+        self._stopping = False
+        self.stop_button.setEnabled(True)
+        QMessageBox.warning(
+            self,
+            "Stop Failed",
+            f"Failed to stop the emulator: {error}"
+        )
+            
     def closeEvent(self, event):
         """Handle window close event."""
-        if self.emulator_running:
+        if self._starting or self._stopping:
+            # QEMU is being started or stopped on the thread pool; closing
+            # now would orphan the process or stop it twice
+            QMessageBox.information(
+                self,
+                "Emulator Busy",
+                "The emulator is still starting or stopping. Try again once it has finished."
+            )
+            event.ignore()
+        elif self.emulator_running:
             reply = QMessageBox.question(
                 self,
                 "Confirm Exit",
@@ -828,23 +1205,36 @@ class EmulatorGUI(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                self.stop_emulator()
+                # Stop QEMU synchronously; the window is going away. It may
+                # have exited while the question was shown
+                self._stop_instrumentation()
+                if self.emulator_running:
+                    self._on_emulator_stopped(self.qemu.stop())
+                self._stop_background_threads()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self._stop_background_threads()
             event.accept()
 
 
 if __name__ == "__main__":
-    # Setup logging
+    # Setup logging; the console and file handlers run on a listener
+    # thread, so logging calls only enqueue the formatted record
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        logging.FileHandler("emulator_gui.log")
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler("emulator_gui.log")
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
     
     # Create and show the GUI
@@ -7,32 +7,160 @@ This module provides a user interface for downloading and managing Android-x86 i
 import sys
 import os
 import logging
+import functools
+import re
 from pathlib import Path
 
 try:
     from PyQt5.QtWidgets import (
         QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, 
-        QProgressBar, QListWidget, QListWidgetItem, QMessageBox, QFileDialog,
-        QGroupBox, QFormLayout, QSpinBox, QApplication, QInputDialog
+        QProgressBar, QListView, QMessageBox, QFileDialog,
+        QGroupBox, QFormLayout, QSpinBox, QInputDialog
+    )
+    from PyQt5.QtCore import (
+        Qt, QTimer, QSignalBlocker, QAbstractListModel, QModelIndex, QFileSystemWatcher,
+        QItemSelection, QItemSelectionModel, QSettings, pyqtSignal
     )
-    from PyQt5.QtCore import Qt, QTimer, pyqtSignal
     from PyQt5.QtGui import QIcon
 except ImportError:
     from PySide6.QtWidgets import (
         QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, 
-        QProgressBar, QListWidget, QListWidgetItem, QMessageBox, QFileDialog,
-        QGroupBox, QFormLayout, QSpinBox, QApplication, QInputDialog
+        QProgressBar, QListView, QMessageBox, QFileDialog,
+        QGroupBox, QFormLayout, QSpinBox, QInputDialog
+    )
+    from PySide6.QtCore import (
+        Qt, QTimer, QSignalBlocker, QAbstractListModel, QModelIndex, QFileSystemWatcher,
+        QItemSelection, QItemSelectionModel, QSettings, Signal as pyqtSignal
     )
-    from PySide6.QtCore import Qt, QTimer, Signal as pyqtSignal
     from PySide6.QtGui import QIcon
 
 from ..core.image_manager import ImageManager
+from .workers import run_in_background
 
 logger = logging.getLogger(__name__)
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Matches any known Android-x86 version in an imported file's path
+_VERSION_RE = re.compile("|".join(re.escape(v) for v in ImageManager.AVAILABLE_VERSIONS))
+
+@functools.lru_cache(maxsize=4096)
+def format_size(size_bytes):
+    """Format file size in bytes to a human-readable string."""
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+        
+    # Each unit is 2**10 times the previous one
+    unit = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (unit * 10)):.2f} {_SIZE_UNITS[unit]}"
+
+class ImageListModel(QAbstractListModel):
+    """List model over the image info dictionaries returned by ImageManager.
+    
+    Display strings are built on demand for the rows the view paints, and a
+    filename index gives constant-time lookups.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._images = []
+        self._labels = []
+        self._row_by_filename = {}
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of images."""
+        if parent.isValid():
+            return 0
+        return len(self._images)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the label or the image info dictionary for a row."""
+        if not index.isValid():
+            return None
+            
+        row = index.row()
+        if role == Qt.DisplayRole:
+            # Labels are built the first time a row is painted and reused
+            # for later repaints
+            label = self._labels[row]
+            if label is None:
+                image_info = self._images[row]
+                label = f"{image_info['filename']} ({format_size(image_info['size'])})"
+                self._labels[row] = label
+            return label
+        if role == Qt.UserRole:
+            return self._images[row]
+        return None
+        
+    def set_images(self, images):
+        """Replace the model contents with a new list of image info dictionaries.
+        
+        Returns False without resetting the model if the list is unchanged.
+        """
+        images = list(images)
+        if images == self._images:
+            # Keep the view's selection when a rescan finds nothing new
+            return False
+            
+        self.beginResetModel()
+        self._images = images
+        self._labels = [None] * len(images)
+        self._row_by_filename = {
+            image_info["filename"]: row for row, image_info in enumerate(self._images)
+        }
+        self.endResetModel()
+        return True
+        
+    def update_image(self, image_info):
+        """Replace the row for an image, or append it as a new row if it is not listed."""
+        row = self._row_by_filename.get(image_info["filename"])
+        if row is not None:
+            self._images[row] = image_info
+            self._labels[row] = None
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+            
+        row = len(self._images)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._images.append(image_info)
+        self._labels.append(None)
+        self._row_by_filename[image_info["filename"]] = row
+        self.endInsertRows()
+        
+    def remove_paths(self, paths):
+        """Remove the rows of the images with the given paths."""
+        paths = set(paths)
+        rows = [row for row, image_info in enumerate(self._images) if image_info["path"] in paths]
+        
+        # Remove from the bottom up so earlier row numbers stay valid
+        for row in reversed(rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._images[row]
+            del self._labels[row]
+            self.endRemoveRows()
+            
+        self._row_by_filename = {
+            image_info["filename"]: row for row, image_info in enumerate(self._images)
+        }
+        
+    def row_of(self, filename):
+        """Return the row of the image with the given filename, or -1."""
+        return self._row_by_filename.get(filename, -1)
+        
+    def contains(self, filename):
+        """Return True if an image with the given filename is listed."""
+        return filename in self._row_by_filename
+        
 class ImageDownloadWidget(QWidget):
     """Widget for downloading and managing Android-x86 images."""
     
+    # Download progress polling: start fast, back off while progress stalls
+    PROGRESS_FAST_INTERVAL = 250
+    PROGRESS_SLOW_INTERVAL = 1000
+    PROGRESS_STALL_POLLS = 5
+    
     # Signal emitted when a new image is downloaded or selected
     # Signal emitting the image info dictionary
     image_selected = pyqtSignal(object)
@@ -45,6 +173,37 @@ class ImageDownloadWidget(QWidget):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_progress)
         
+        # Target of the running download, the last progress value shown and
+        # how many polls in a row saw no change
+        self._download_target = None
+        self._last_progress = -1
+        self._stalled_polls = 0
+        
+        # Set while an import runs in the background; it shares the
+        # progress bar with downloads
+        self._importing = False
+        
+        # Directory the import dialog opens in; remembered across sessions
+        self._settings = QSettings("undetected-emulator", "gui")
+        self._last_import_dir = self._settings.value("last_import_dir", "")
+        if not self._last_import_dir:
+            # Default to Downloads directory if it exists, otherwise home directory
+            downloads_dir = Path.home() / "Downloads"
+            self._last_import_dir = str(downloads_dir if downloads_dir.is_dir() else Path.home())
+            
+        # Created on first import and reused so it keeps its state
+        self._import_dialog = None
+        
+        # Rescan when the storage directory changes; bursts of changes are
+        # coalesced into one scan
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self.update_image_list)
+        
+        self._storage_watcher = QFileSystemWatcher([str(self.image_manager.storage_dir)], self)
+        self._storage_watcher.directoryChanged.connect(self._refresh_timer.start)
+        
         self.init_ui()
         self.populate_version_dropdown()
         self.update_image_list()
@@ -57,12 +216,15 @@ class ImageDownloadWidget(QWidget):
         images_group = QGroupBox("Available Images")
         images_layout = QVBoxLayout(images_group)
         
-        self.image_list = QListWidget()
-        self.image_list.setSelectionMode(QListWidget.SingleSelection)
-        self.image_list.itemSelectionChanged.connect(self.on_image_selected)
+        self.image_model = ImageListModel(self)
+        self.image_list = QListView()
+        self.image_list.setModel(self.image_model)
+        self.image_list.setUniformItemSizes(True)
+        self.image_list.setSelectionMode(QListView.ExtendedSelection)
+        self.image_list.selectionModel().selectionChanged.connect(self.on_image_selected)
         
         refresh_button = QPushButton("Refresh")
-        refresh_button.clicked.connect(self.update_image_list)
+        refresh_button.clicked.connect(self.refresh_image_list)
         
         delete_button = QPushButton("Delete")
         delete_button.clicked.connect(self.delete_selected_image)
@@ -154,47 +316,97 @@ class ImageDownloadWidget(QWidget):
         
     def populate_version_dropdown(self):
         """Populate the version dropdown with available Android-x86 versions."""
-        self.version_dropdown.clear()
-        self.version_dropdown.addItems(self.image_manager.AVAILABLE_VERSIONS)
+        versions = self.image_manager.AVAILABLE_VERSIONS
+        if self.version_dropdown.count() == len(versions):
+            return  # Already populated; the version list is fixed
+            
+        with QSignalBlocker(self.version_dropdown):
+            self.version_dropdown.clear()
+            self.version_dropdown.addItems(versions)
         
     def update_image_list(self):
-        """Update the list of available images."""
-        self.image_list.clear()
+        """Update the list of available images.
+        
+        The directory scan runs on the thread pool; ImageManager skips it
+        when the storage directory has not changed since the last scan.
+        """
+        run_in_background(
+            self.image_manager.get_available_images,
+            on_finished=self._on_images_scanned,
+            on_failed=self._on_scan_failed
+        )
         
-        available_images = self.image_manager.get_available_images(force_refresh=True)
+    def refresh_image_list(self):
+        """Rescan the storage directory, bypassing ImageManager's cache.
         
-        for image in available_images:
-            item = QListWidgetItem()
-            item.setText(f"{image['filename']} ({self.format_size(image['size'])})")
-            # Store the entire image info dictionary
-            item.setData(Qt.UserRole, image)
-            self.image_list.addItem(item)
+        Files overwritten in place do not change the directory's
+        modification time, so the Refresh button always rescans.
+        """
+        run_in_background(
+            functools.partial(self.image_manager.get_available_images, force_refresh=True),
+            on_finished=self._on_images_scanned,
+            on_failed=self._on_scan_failed
+        )
+        
+    def _on_images_scanned(self, images):
+        """Fill the model from a scan and restore the selected images."""
+        selection_model = self.image_list.selectionModel()
+        selected = [index.data(Qt.UserRole)["filename"] for index in selection_model.selectedIndexes()]
+        
+        # The reset clears the selection; restore it with the selection
+        # model's signals blocked and report the result once
+        with QSignalBlocker(selection_model):
+            if not self.image_model.set_images(images):
+                return
+                
+            selection = QItemSelection()
+            for filename in selected:
+                row = self.image_model.row_of(filename)
+                if row >= 0:
+                    index = self.image_model.index(row)
+                    selection.select(index, index)
+            selection_model.select(selection, QItemSelectionModel.Select)
+            
+        self.image_list.viewport().update()
+        if not selection.isEmpty():
+            self.on_image_selected()
             
+    def _on_scan_failed(self, error):
+        """Log a failed image directory scan."""
+        logger.error(f"Failed to scan for images: {error}")
+        
     def format_size(self, size_bytes):
         """Format file size in bytes to a human-readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
+        return format_size(size_bytes)
+        
+    def _selected_image_info(self):
+        """Return the image info of the selected row, or None."""
+        indexes = self.image_list.selectionModel().selectedIndexes()
+        if indexes:
+            return indexes[0].data(Qt.UserRole)
+        return None
         
     def download_image(self):
         """Download a new Android-x86 image."""
+        if self._importing:
+            QMessageBox.information(
+                self,
+                "Busy",
+                "Please wait for the current import to finish."
+            )
+            return
+            
         version = self.version_dropdown.currentText()
         image_type = self.type_dropdown.currentText()
         
         # Check if image already exists
-        for i in range(self.image_list.count()):
-            item = self.image_list.item(i)
-            image_info = item.data(Qt.UserRole)
-            path = image_info['path']
-            if f"android-x86_{version}_{image_type}.iso" in path:
-                QMessageBox.information(
-                    self,
-                    "Image Already Exists",
-                    f"The selected image (Android {version} {image_type}) already exists."
-                )
-                return
+        if self.image_model.contains(f"android-x86_{version}_{image_type}.iso"):
+            QMessageBox.information(
+                self,
+                "Image Already Exists",
+                f"The selected image (Android {version} {image_type}) already exists."
+            )
+            return
         
         # Start the download
         result = self.image_manager.download_image(
@@ -204,9 +416,12 @@ class ImageDownloadWidget(QWidget):
         )
         
         if result:
+            self._download_target = result
+            self._last_progress = -1
+            self._stalled_polls = 0
             self.progress_bar.setVisible(True)
             self.cancel_button.setVisible(True)
-            self.timer.start(500)  # Update progress every 500ms
+            self.timer.start(self.PROGRESS_FAST_INTERVAL)
             
             logger.info(f"Started downloading Android-x86 {version} ({image_type})")
         else:
@@ -219,13 +434,34 @@ class ImageDownloadWidget(QWidget):
     def update_progress(self):
         """Update the download progress bar."""
         if self.image_manager.current_download:
-            self.progress_bar.setValue(self.image_manager.download_progress)
+            progress = int(self.image_manager.download_progress)
+            if progress != self._last_progress:
+                self._last_progress = progress
+                self.progress_bar.setValue(progress)
+                
+                if self._stalled_polls >= self.PROGRESS_STALL_POLLS:
+                    self.timer.setInterval(self.PROGRESS_FAST_INTERVAL)
+                self._stalled_polls = 0
+            else:
+                self._stalled_polls += 1
+                if self._stalled_polls == self.PROGRESS_STALL_POLLS:
+                    self.timer.setInterval(self.PROGRESS_SLOW_INTERVAL)
         else:
             # Download completed or failed
             self.timer.stop()
             self.progress_bar.setVisible(False)
             self.cancel_button.setVisible(False)
-            self.update_image_list()
+            self._add_downloaded_image()
+            
+    def _add_downloaded_image(self):
+        """Add the finished download to the list without rescanning the directory."""
+        target, self._download_target = self._download_target, None
+        if not target or not os.path.exists(target):
+            return
+            
+        image_info = self.image_manager.get_image_info(target)
+        if image_info:
+            self.image_model.update_image(image_info)
             
     def cancel_download(self):
         """Cancel the current download."""
@@ -238,71 +474,74 @@ class ImageDownloadWidget(QWidget):
         
     def on_image_selected(self):
         """Handle image selection in the list."""
-        items = self.image_list.selectedItems()
-        if items:
-            image_info = items[0].data(Qt.UserRole)
+        image_info = self._selected_image_info()
+        if image_info:
             self.image_selected.emit(image_info)
             
     def delete_selected_image(self):
-        """Delete the selected image."""
-        items = self.image_list.selectedItems()
-        if items:
-            image_info = items[0].data(Qt.UserRole)
-            image_path = image_info['path']
+        """Delete the selected images."""
+        selected = [
+            index.data(Qt.UserRole) for index in self.image_list.selectionModel().selectedIndexes()
+        ]
+        if selected:
+            filenames = "\n".join(image_info['filename'] for image_info in selected)
             
             # Ask for confirmation
             reply = QMessageBox.question(
                 self,
                 "Confirm Deletion",
-                f"Are you sure you want to delete the selected image?\n\n{image_info['filename']}",
+                f"Are you sure you want to delete the selected images?\n\n{filenames}",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
             
             if reply == QMessageBox.Yes:
-                if self.image_manager.delete_image(image_path):
-                    self.update_image_list()
-                    logger.info(f"Deleted image: {image_path}")
-                else:
+                deleted = self.image_manager.delete_images(
+                    [image_info['path'] for image_info in selected]
+                )
+                self.image_model.remove_paths(deleted)
+                
+                if len(deleted) < len(selected):
                     QMessageBox.warning(
                         self,
                         "Deletion Error",
-                        "Failed to delete the image. See the logs for details."
+                        "Failed to delete some of the images. See the logs for details."
                     )
                     
     def import_image(self):
         """Import an existing Android-x86 image."""
-        # Default to Downloads directory if it exists, otherwise home directory
-        default_dir = str(Path.home() / "Downloads")
-        if not os.path.exists(default_dir):
-            default_dir = str(Path.home())
+        if self._importing or self.timer.isActive():
+            QMessageBox.information(
+                self,
+                "Busy",
+                "Please wait for the current download or import to finish."
+            )
+            return
             
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Android-x86 ISO Image",
-            default_dir,
-            "ISO Images (*.iso);;All Files (*)"
-        )
-        
-        if not file_path:
+        if self._import_dialog is None:
+            self._import_dialog = QFileDialog(
+                self,
+                "Select Android-x86 ISO Image",
+                self._last_import_dir,
+                "ISO Images (*.iso);;All Files (*)"
+            )
+            self._import_dialog.setFileMode(QFileDialog.ExistingFile)
+            
+        if not self._import_dialog.exec_():
             return  # User cancelled
             
-        import shutil
-        
-        # Get the destination directory and filename
-        target_basename = os.path.basename(file_path)
+        file_path = self._import_dialog.selectedFiles()[0]
+        self._last_import_dir, source_basename = os.path.split(file_path)
+        self._settings.setValue("last_import_dir", self._last_import_dir)
+            
+        # Get the destination filename
+        target_basename = source_basename
         
         # If the filename doesn't look like an Android-x86 image, suggest renaming it
         if not target_basename.startswith("android-x86"):
             # Guess the version from the file name if possible
-            version = None
-            for v in self.image_manager.AVAILABLE_VERSIONS:
-                if v in file_path:
-                    version = v
-                    break
-                    
-            if not version:
-                version = "9.0-r2"  # Default to latest version
+            match = _VERSION_RE.search(file_path)
+            version = match.group(0) if match else "9.0-r2"  # Default to latest version
                 
             # Guess architecture
             arch = "x86_64" if "64" in file_path else "x86"
@@ -328,14 +567,13 @@ class ImageDownloadWidget(QWidget):
                 target_basename = suggested_name
         
         try:
-            # Ensure the target directory exists
-            os.makedirs(self.image_manager.storage_dir, exist_ok=True)
-            
-            # Final target path
+            # Final target path; ImageManager created the storage directory
+            # when the widget was set up
             target_path = os.path.join(self.image_manager.storage_dir, target_basename)
             
-            # Check if the file already exists
-            if os.path.exists(target_path):
+            # Check if the file already exists; the model answers for scanned
+            # images and the stat only runs for files it does not list
+            if self.image_model.contains(target_basename) or os.path.exists(target_path):
                 confirm = QMessageBox.question(
                     self,
                     "File Exists",
@@ -347,57 +585,60 @@ class ImageDownloadWidget(QWidget):
                 if confirm != QMessageBox.Yes:
                     return
             
-            # Show progress message
-            progress_msg = QMessageBox(self)
-            progress_msg.setWindowTitle("Importing Image")
-            progress_msg.setText(f"Copying {os.path.basename(file_path)}...\nThis may take a while for large files.")
-            progress_msg.setStandardButtons(QMessageBox.NoButton)
-            progress_msg.show()
-            
-            # Process events to update the UI
-            QApplication.processEvents()
+            # Show progress; the import runs on the thread pool and the
+            # progress bar is hidden again by the completion callbacks
+            self._importing = True
+            self.progress_bar.setValue(0)
+            self.progress_bar.setVisible(True)
+            logger.info(f"Importing {source_basename}")
             
-            try:
-                # Copy the file
-                shutil.copy2(file_path, target_path)
-                
-                # Close progress message
-                progress_msg.close()
-                
-                QMessageBox.information(
-                    self,
-                    "Import Successful",
-                    f"Imported '{target_basename}' successfully."
-                )
-                
-                logger.info(f"Imported image from {file_path} to {target_path}")
-                
-                # Update the image list
-                self.update_image_list()
-                
-                # Select the imported image
-                for i in range(self.image_list.count()):
-                    item = self.image_list.item(i)
-                    image_info = item.data(Qt.UserRole)
-                    if image_info["path"] == target_path:
-                        self.image_list.setCurrentItem(item)
-                        # Emit the selected image info
-                        self.image_selected.emit(image_info)
-                        break
-            finally:
-                # Close progress message if it's still open
-                try:
-                    progress_msg.close()
-                except:
-                    pass
+            run_in_background(
+                self.image_manager.import_file,
+                file_path,
+                target_path,
+                on_finished=self._on_import_finished,
+                on_failed=self._on_import_failed,
+                on_progress=self.progress_bar.setValue,
+                priority=-1
+            )
                     
         except Exception as e:
-            logger.error(f"Failed to import image: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Import Error",
-                f"Failed to import the image:\n\n{str(e)}\n\nPlease make sure you have permissions to copy files and enough disk space."
-            )
+            self._on_import_failed(str(e))
+            
+    def _close_import_progress(self):
+        """Hide the import progress bar."""
+        if self._importing:
+            self._importing = False
+            self.progress_bar.setVisible(False)
+            
+    def _on_import_finished(self, target_path):
+        """Report a completed image import and select the new image."""
+        self._close_import_progress()
+        target_basename = os.path.basename(target_path)
+        
+        QMessageBox.information(
+            self,
+            "Import Successful",
+            f"Imported '{target_basename}' successfully."
+        )
+        
+        # Add the image to the list and select it; the selection change
+        # emits image_selected
+        image_info = self.image_manager.get_image_info(target_path)
+        if image_info:
+            self.image_model.update_image(image_info)
+            row = self.image_model.row_of(target_basename)
+            self.image_list.setCurrentIndex(self.image_model.index(row))
+            
+    def _on_import_failed(self, error):
+        """Report a failed image import."""
+        self._close_import_progress()
+        logger.error(f"Failed to import image: {error}")
+        QMessageBox.critical(
+            self,
+            "Import Error",
+            f"Failed to import the image:\n\n{error}\n\nPlease make sure you have permissions to copy files and enough disk space."
+        )
                 
     def create_data_image(self):
         """Create a new data image file."""
@@ -411,27 +652,31 @@ class ImageDownloadWidget(QWidget):
         )
         
         if ok and name:
-            # Create the image
-            result = self.image_manager.create_empty_image(name, size_gb=size_gb)
+            # Create the image on the thread pool; qemu-img can take a while
+            # on slow storage
+            run_in_background(
+                self.image_manager.create_empty_image,
+                name,
+                size_gb=size_gb,
+                on_finished=functools.partial(self._on_data_image_created, size_gb),
+                priority=-1
+            )
             
-            if result:
-                QMessageBox.information(
-                    self,
-                    "Data Image Created",
-                    f"Created a {size_gb}GB data image at:\n{result}"
-                )
-                
-                self.update_image_list()
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Creation Error",
-                    "Failed to create the data image. See the logs for details."
-                )
+    def _on_data_image_created(self, size_gb, result):
+        """Report the result of create_data_image."""
+        if result:
+            QMessageBox.information(
+                self,
+                "Data Image Created",
+                f"Created a {size_gb}GB data image at:\n{result}"
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Creation Error",
+                "Failed to create the data image. See the logs for details."
+            )
                 
     def get_selected_image(self):
         """Get the image info of the currently selected image, or None if none selected."""
-        items = self.image_list.selectedItems()
-        if items:
-            return items[0].data(Qt.UserRole)
-        return None
\ No newline at end of file
+        return self._selected_image_info()
\ No newline at end of file
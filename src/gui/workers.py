@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Background workers for the undetected Android emulator GUI.
+This module provides helpers for running blocking work off the UI thread.
+"""
+
+import logging
+
+try:
+    from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+except ImportError:
+    from PySide6.QtCore import (
+        QObject, QRunnable, QThreadPool, QTimer, Signal as pyqtSignal, Slot as pyqtSlot
+    )
+
+logger = logging.getLogger(__name__)
+
+class WorkerSignals(QObject):
+    """Signals used by FunctionWorker to report back to the UI thread."""
+
+    # Emitted with the return value of the function
+    finished = pyqtSignal(object)
+
+    # Emitted with the error message if the function raised
+    failed = pyqtSignal(str)
+
+    # Emitted with a percentage by functions that report progress
+    progress = pyqtSignal(int)
+
+class FunctionWorker(QRunnable):
+    """Runs a function on a thread pool and reports the result via signals."""
+
+    def __init__(self, fn, *args, **kwargs):
+        """Initialize the worker with the function and its arguments."""
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Run the function and emit its result."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Background task failed: {str(e)}")
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(result)
+
+def run_in_background(fn, *args, on_finished=None, on_failed=None, on_progress=None, priority=0,
+                      **kwargs):
+    """Run a function on the global thread pool.
+
+    The callbacks are invoked on the UI thread through queued signal
+    connections. If on_progress is given, the function is called with a
+    progress keyword argument it can call with a percentage. Queued tasks
+    with a higher priority start first. Returns the worker so callers can
+    keep a reference to it.
+    """
+    worker = FunctionWorker(fn, *args, **kwargs)
+
+    if on_progress is not None:
+        worker.kwargs["progress"] = worker.signals.progress.emit
+        worker.signals.progress.connect(on_progress)
+
+    if on_finished is not None:
+        worker.signals.finished.connect(on_finished)
+    if on_failed is not None:
+        worker.signals.failed.connect(on_failed)
+
+    QThreadPool.globalInstance().start(worker, priority)
+    return worker
+
+class ProcessMonitor(QObject):
+    """Polls a liveness check on a timer owned by the monitor's thread.
+    
+    Move the monitor to a QThread and call start() and stop() through queued
+    signal connections; results arrive on the UI thread through alive_polled.
+    """
+
+    # Emitted with the result of every poll
+    alive_polled = pyqtSignal(bool)
+
+    def __init__(self, is_alive, interval=1000):
+        """Initialize the monitor with the liveness callable and poll interval in ms."""
+        super().__init__()
+        self.is_alive = is_alive
+        self.interval = interval
+        self._timer = None
+
+    @pyqtSlot()
+    def start(self):
+        """Start polling; must run in the monitor's thread."""
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.timeout.connect(self.poll)
+        self._timer.start(self.interval)
+
+    @pyqtSlot()
+    def stop(self):
+        """Stop polling."""
+        if self._timer is not None:
+            self._timer.stop()
+
+    @pyqtSlot()
+    def poll(self):
+        """Run the liveness check and report the result."""
+        try:
+            alive = bool(self.is_alive())
+        except Exception as e:
+            logger.error(f"Liveness check failed: {str(e)}")
+            alive = False
+
+        self.alive_polled.emit(alive)
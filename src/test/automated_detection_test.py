@@ -7,13 +7,15 @@ This module provides a framework for automated testing of emulator detection byp
 import os
 import sys
 import logging
-import json
 import time
 import argparse
 from pathlib import Path
 import subprocess
 import threading
 import csv
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
 # Add parent directory to path to import our modules
@@ -26,6 +28,7 @@ try:
     from anti_detection.sensor_simulator import SensorSimulator
     from anti_detection.frida_manager import FridaManager
     from anti_detection.device_profiles import DeviceProfileDatabase
+    from anti_detection.json_io import write_json
     from .linkedin_detection_test import LinkedInDetectionTest
 except ImportError as e:
     print(f"Error importing modules: {e}")
@@ -37,9 +40,14 @@ logger = logging.getLogger(__name__)
 class AutomatedDetectionTest:
     """Framework for automated testing of emulator detection bypass."""
     
-    def __init__(self, output_dir=None, dry_run=False):
-        """Initialize the automated testing framework."""
+    def __init__(self, output_dir=None, dry_run=False, adb_serial=None):
+        """Initialize the automated testing framework.
+        
+        adb_serial identifies the emulator to adb (e.g. "localhost:5555" when
+        QEMU forwards the guest's adb port); without it boot is not polled.
+        """
         self.dry_run = dry_run
+        self.adb_serial = adb_serial
         self.output_dir = output_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
         os.makedirs(self.output_dir, exist_ok=True)
         
@@ -123,10 +131,50 @@ class AutomatedDetectionTest:
             
         # Wait for system to boot
         logger.info("Waiting for system to boot...")
-        time.sleep(60)  # In a real implementation, we would check for boot completion
+        if self._wait_for_boot():
+            logger.info("System booted")
         
         return True
         
+    def _wait_for_boot(self, timeout=60):
+        """Wait up to timeout seconds for Android to report boot completion.
+        
+        Polls sys.boot_completed on the emulator's adb serial, backing off
+        from 0.1 to 1 second between attempts. Without a serial, or if adb is
+        not installed, the full timeout is waited out, as before. Returns True
+        if the boot was confirmed.
+        """
+        if not self.adb_serial:
+            # Plain "adb shell" would ask whatever other device is attached
+            time.sleep(timeout)
+            return False
+            
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        
+        while True:
+            try:
+                result = subprocess.run(
+                    ["adb", "-s", self.adb_serial, "shell", "getprop", "sys.boot_completed"],
+                    capture_output=True, text=True, timeout=2
+                )
+                if result.stdout.strip() == "1":
+                    return True
+            except FileNotFoundError:
+                logger.warning("adb not found, waiting for boot without checking")
+                time.sleep(max(0, deadline - time.monotonic()))
+                return False
+            except subprocess.TimeoutExpired:
+                pass
+                
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Boot completion not confirmed after {timeout} seconds, continuing")
+                return False
+                
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 1.0)
+        
     def _install_linkedin(self):
         """Install LinkedIn app on the emulator."""
         logger.info("Installing LinkedIn app")
@@ -175,8 +223,7 @@ class AutomatedDetectionTest:
             # Save results to file
             timestamp = time.strftime("%Y%m%d-%H%M%S")
             output_file = os.path.join(self.output_dir, f"{test_case['name']}_{timestamp}.json")
-            with open(output_file, "w") as f:
-                json.dump(results, f, indent=2)
+            write_json(output_file, results)
                 
             logger.info(f"Test results saved to {output_file}")
             
@@ -243,35 +290,36 @@ class AutomatedDetectionTest:
         timestamp = time.strftime("%Y%m%d-%H%M%S")
         report_file = os.path.join(self.output_dir, f"detection_test_report_{timestamp}.csv")
         
+        def format_timestamp(timestamp):
+            """Format a test timestamp for the report, or N/A if it is unset."""
+            if not timestamp:
+                return "N/A"
+            return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+            
         try:
-            with open(report_file, "w", newline="") as f:
+            # Build all rows first so they are written in one pass
+            rows = []
+            for test in self.test_results:
+                device = f"{test['device_profile']['manufacturer']} {test['device_profile']['model']}"
+                success = "N/A" if test["result"] is None else str(test["result"]["success"])
+                duration = "N/A"
+                if test["start_time"] and test["end_time"]:
+                    duration = str(round(test["end_time"] - test["start_time"], 2))
+                    
+                summary = "N/A" if test["result"] is None else test["result"].get("summary", "N/A")
+                
+                rows.append([
+                    test["name"], device, test["status"], success, duration,
+                    summary, format_timestamp(test["start_time"]), format_timestamp(test["end_time"])
+                ])
+                
+            with open(report_file, "w", newline="", buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow([
                     "Test Name", "Device", "Status", "Success", "Duration (s)", 
                     "Summary", "Started", "Completed"
                 ])
-                
-                for test in self.test_results:
-                    device = f"{test['device_profile']['manufacturer']} {test['device_profile']['model']}"
-                    success = "N/A" if test["result"] is None else str(test["result"]["success"])
-                    duration = "N/A"
-                    if test["start_time"] and test["end_time"]:
-                        duration = str(round(test["end_time"] - test["start_time"], 2))
-                        
-                    summary = "N/A" if test["result"] is None else test["result"].get("summary", "N/A")
-                    
-                    start_time = "N/A"
-                    if test["start_time"]:
-                        start_time = datetime.fromtimestamp(test["start_time"]).strftime("%Y-%m-%d %H:%M:%S")
-                        
-                    end_time = "N/A"
-                    if test["end_time"]:
-                        end_time = datetime.fromtimestamp(test["end_time"]).strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    writer.writerow([
-                        test["name"], device, test["status"], success, duration,
-                        summary, start_time, end_time
-                    ])
+                writer.writerows(rows)
                     
             logger.info(f"Test report generated: {report_file}")
             return report_file
@@ -320,29 +368,37 @@ def main():
     parser.add_argument("--profile", help="Specific device profile to test")
     parser.add_argument("--android-version", help="Android version to use")
     parser.add_argument("--duration", type=int, default=60, help="Test duration in seconds")
+    parser.add_argument("--adb-serial", help="adb serial of the emulator, used to detect boot completion")
     args = parser.parse_args()
     
-    # Configure logging
+    # Configure logging; the console and file handlers run on a listener
+    # thread, so logging calls only enqueue the formatted record
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        logging.FileHandler("automated_test.log")
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler("automated_test.log")
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
     
     logger.info("Starting Automated Detection Test Framework")
     
     # Create the test framework
-    test_framework = AutomatedDetectionTest(output_dir=args.output_dir)
+    test_framework = AutomatedDetectionTest(output_dir=args.output_dir, adb_serial=args.adb_serial)
     
     # Create test cases
     test_cases = []
     
     if args.profile:
-        # Test a specific profile
-        profile_db = DeviceProfileDatabase()
+        # Test a specific profile; reuse the framework's profile database
+        profile_db = test_framework.profile_db
         profile = profile_db.get_profile(args.profile)
         
         if not profile: